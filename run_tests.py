@@ -3,6 +3,9 @@
 
 import sys
 import os
+from functools import partial
+
+import pytest
 
 # Add project root to path
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -33,6 +36,7 @@ from tests.test_soliloquy import (
     test_sentiment_analysis,
     test_record_user_response,
 )
+from src.body.aozora_harvester import AozoraHarvester
 from tests.test_aozora import (
     test_aozora_init,
     test_aozora_get_random_work,
@@ -87,10 +91,9 @@ from tests.test_memory_distortion import (
 )
 
 def test_brain_integration_wrapper():
-    """Wrapper to run unittest-based brain integration tests"""
-    from tests.test_brain_integration import run_tests as run_brain_tests
+    """Wrapper to run fixture-based brain integration tests (via pytest)"""
     print("\n[Running Sub-Suite: Brain Integration]")
-    if not run_brain_tests():
+    if pytest.main([os.path.join(PROJECT_ROOT, "tests", "test_brain_integration.py"), "-q"]) != 0:
         raise AssertionError("Brain Integration Tests Failed")
     print("[End Sub-Suite]\n")
 
@@ -105,6 +108,9 @@ def test_vision_wrapper():
 def run_all():
     """全テストを実行し、結果をサマリー表示"""
     
+    # pytest ならフィクスチャ (tests/test_aozora.py の harvester) が渡すものを自前で用意
+    aozora = AozoraHarvester()
+    
     tests = [
         # Hormones
         ("Hormones: initialization", test_initialization),
@@ -131,9 +137,9 @@ def run_all():
         ("Soliloquy: response", test_record_user_response),
         
         # Aozora (Phase 3 Extension)
-        ("Aozora: init", test_aozora_init),
-        ("Aozora: random_work", test_aozora_get_random_work),
-        ("Aozora: resolve_url", test_aozora_resolve_url),
+        ("Aozora: init", partial(test_aozora_init, aozora)),
+        ("Aozora: random_work", partial(test_aozora_get_random_work, aozora)),
+        ("Aozora: resolve_url", partial(test_aozora_resolve_url, aozora)),
         
         # Personality (Phase 6)
         ("Personality: init", test_personality_init),
@@ -3,6 +3,7 @@ import time
 import math
 import random
 import threading
+import numpy as np
 import pyautogui
 import queue
 import queue
@@ -119,7 +120,7 @@ class KanameBody:
         self.target_x = config.DEFAULT_X
         self.target_y = config.DEFAULT_Y
         self.bubbles = []
-        self.grid_motion = [[0.0 for _ in range(config.RETINA_MOTION_GRID_COLS)] for _ in range(config.RETINA_MOTION_GRID_ROWS)]
+        self.grid_motion = np.zeros((config.RETINA_MOTION_GRID_ROWS, config.RETINA_MOTION_GRID_COLS), dtype=np.float32)
         
         self.cursor_history = []
         self.pet_counter = 0
@@ -729,7 +730,7 @@ class KanameBody:
         """ 自律移動・物理演算ループ (Thread) """
         rows = config.RETINA_MOTION_GRID_ROWS
         cols = config.RETINA_MOTION_GRID_COLS
-        self.grid_motion = [[0.0 for _ in range(cols)] for _ in range(rows)] 
+        self.grid_motion = np.zeros((rows, cols), dtype=np.float32)
         
         while self.is_alive:
             # Mouse Tracking
@@ -832,13 +833,12 @@ class KanameBody:
                 max_move, max_gx, max_gy = 0.0, 1, 1
                 
                 with self.grid_lock:
-                    local_grid = [row[:] for row in self.grid_motion] # Copy under lock
+                    local_grid = np.array(self.grid_motion, dtype=np.float32) # Copy under lock
                 
-                for gy in range(config.RETINA_MOTION_GRID_ROWS):
-                    for gx in range(config.RETINA_MOTION_GRID_COLS):
-                        if local_grid[gy][gx] > max_move:
-                            max_move = local_grid[gy][gx]
-                            max_gx, max_gy = gx, gy
+                flat_idx = int(local_grid.argmax())
+                if local_grid.flat[flat_idx] > max_move:
+                    max_move = float(local_grid.flat[flat_idx])
+                    max_gy, max_gx = divmod(flat_idx, local_grid.shape[1])
                 
                 if max_move > 0.01:
                     self.target_x = int(self.screen_w * (max_gx + 0.5) / config.RETINA_MOTION_GRID_COLS) - 150
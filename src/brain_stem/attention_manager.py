@@ -18,6 +18,7 @@ Phase 6: Attention Manager
 import time
 import random
 import threading
+import numpy as np
 
 
 class AttentionManager:
@@ -78,7 +79,7 @@ class AttentionManager:
         周辺視野の動き → 興味方向
         
         Args:
-            peripheral_data: {"motion_grid": [[...], ...], ...}
+            peripheral_data: {"motion_grid": (rows, cols) ndarray, ...}
             
         Returns:
             (fx, fy): 動きの方向ベクトル
@@ -86,19 +87,17 @@ class AttentionManager:
         if not peripheral_data:
             return (0.0, 0.0)
         
-        motion_grid = peripheral_data.get("motion_grid", [])
-        if not motion_grid:
+        motion_grid = peripheral_data.get("motion_grid")
+        if motion_grid is None:
+            return (0.0, 0.0)
+        motion_grid = np.asarray(motion_grid, dtype=np.float32)
+        if motion_grid.ndim != 2 or motion_grid.size == 0:
             return (0.0, 0.0)
         
-        # 最も動きが大きいグリッドを探す
-        max_motion = 0
-        max_row, max_col = 1, 1  # 中央がデフォルト
-        
-        for row_idx, row in enumerate(motion_grid):
-            for col_idx, val in enumerate(row):
-                if val > max_motion:
-                    max_motion = val
-                    max_row, max_col = row_idx, col_idx
+        # 最も動きが大きいグリッドを探す (先勝ち = 元のループと同じ)
+        flat_idx = int(motion_grid.argmax())
+        max_motion = float(motion_grid.flat[flat_idx])
+        max_row, max_col = divmod(flat_idx, motion_grid.shape[1])
         
         # 動きが閾値以上なら興味
         if max_motion > self.motion_interest_threshold:
@@ -49,6 +49,8 @@ class KanameBrain:
         
         # Thread Lock [Phase 10]
         self.lock = threading.Lock()
+        # 初期化完了通知 (__init__ の最後で set)
+        self.ready_event = threading.Event()
         
         # 1. 生理層 (Hormones) - Phase 8: HormoneManager (The Iron Heart)
         from src.body.hormones import Hormone, HormoneManager
@@ -274,6 +276,9 @@ class KanameBrain:
              importer = KnowledgeImporter(self.knowledge_graph)
              importer.import_from_directory() # defaults to data/learning
         threading.Thread(target=_auto_import, daemon=True).start()
+        
+        # All subsystems constructed
+        self.ready_event.set()
     
     @property
     def current_geo_y(self):
@@ -332,6 +337,18 @@ class KanameBrain:
         
         self.name_map[name].potential += boost
 
+    def activate_concepts_batch(self, names, boost=1.0):
+        """ activate_concept の一括版 (ロック取得は1回) """
+        with self.lock:
+            name_map = self.name_map
+            for name in names:
+                n = name_map.get(name)
+                if n is None:
+                    n = Neuron(name, is_sensor=False)
+                    self.neurons.append(n)
+                    name_map[name] = n
+                n.potential += boost
+
     def prune_neurons(self):
         """ Apoptosis: 死んだニューロンの除去 (Memory Leak Prevention) """
         # 死滅条件: 電位が低く、かつ長時間発火していない、かつセンサーでない
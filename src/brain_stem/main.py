@@ -243,7 +243,7 @@ class MaiaSystem:
             # Phase 14: Retina Guided Movement (Reflex)
             # Fetch Motion Grid independently (High Speed 10Hz)
             m_data = self.senses.get_grid_motion()
-            if m_data:
+            if m_data is not None:
                 self.body.update_visual_senses(m_data)
             
             env_effect = self.senses.get_atmosphere()
@@ -130,41 +130,63 @@ class PredictionEngine:
             print(f"⚠️ Soul Save Error: {e}")
 
     def _get_embedding_api(self, text):
-        """ Call Gemini Embedding API with Cache """
-        if not self.embedding_model: return None
+        """ Call Gemini Embedding API with Cache (single-text form of _get_embeddings_api) """
+        return self._get_embeddings_api([text])[0]
+
+    def _get_embeddings_api(self, texts):
+        """ Call Gemini Embedding API with Cache: cache hits first, then ONE API call for all misses """
+        if not self.embedding_model: return [None] * len(texts)
         
-        # 1. Check Cache First
-        cached = self.embedding_cache.get(text)
-        if cached is not None:
-            return cached
+        vecs = [self.embedding_cache.get(t) for t in texts]
+        misses = [i for i, v in enumerate(vecs) if v is None]
+        if not misses:
+            return vecs
         
-        # 2. API Call (Cache Miss)
         try:
-            normalized_text = text.replace("\n", " ")
             result = genai.embed_content(
                 model=self.embedding_model,
-                content=normalized_text,
+                content=[texts[i].replace("\n", " ") for i in misses],
                 task_type="clustering",
             )
-            vec = np.array(result['embedding'])
-            
-            # 3. Store in Cache
-            self.embedding_cache.set(text, vec)
+            for i, emb in zip(misses, result['embedding']):
+                vec = np.array(emb)
+                self.embedding_cache.set(texts[i], vec)
+                # --- Phase 3: HDC Auto-Update ---
+                if self.brain_ref and hasattr(self.brain_ref, 'memory'):
+                     self.brain_ref.memory.update_hash(texts[i], vec)
+                vecs[i] = vec
+        except Exception:
+            # Quiet on purpose (called per input while offline): misses stay None -> hash fallback
+            pass
+        return vecs
 
-            # Output dimensions check (Safeguard)
-            if len(vec) != self.input_dim:
-                 # Reset dimensions logic... (omitted for brevity in prompt, keep existing)
-                 pass 
+    @staticmethod
+    def _hash_embedding(text):
+        """ Fallback: Hash 64-dim * 12 -> 768-dim (Syntactic) """
+        temp_dim = 64
+        hash_vec = np.zeros(temp_dim)
+        seed = 0
+        for char in text[-50:]: 
+            seed = (seed * 31 + ord(char)) % (2**32)
+            idx = seed % (temp_dim - 2) + 2
+            val = (seed % 100) / 100.0
+            hash_vec[idx] += val
+        
+        # Normalize Hash
+        norm = np.linalg.norm(hash_vec)
+        if norm > 0: hash_vec = hash_vec / norm
+        
+        # Tile to 768
+        return np.tile(hash_vec, 12) # 64 * 12 = 768
 
-            # --- Phase 3: HDC Auto-Update ---
-            # Automatically store SimHash in Memory for fast retrieval
-            if self.brain_ref and hasattr(self.brain_ref, 'memory'):
-                 self.brain_ref.memory.update_hash(text, vec)
-                 
-            return vec
-        except Exception as e:
-            # print(f"⚠️ Embedding API Error: {e}")
-            return None
+    @staticmethod
+    def _add_hour_signal(vec, hour):
+        """ Add Hour Signal (Cyclic) - Mutate first 2 dims """
+        # We overlay time context onto the semantic vector
+        angle = (hour / 24.0) * 2 * math.pi
+        vec[0] += math.sin(angle) * 0.1 # Small influence
+        vec[1] += math.cos(angle) * 0.1
+        return vec
 
     def _get_embedding(self, text, hour):
         """ Projection of Text+Context into Input Space (Hybrid) """
@@ -174,30 +196,18 @@ class PredictionEngine:
         
         # 2. Fallback to Hash (Syntactic)
         if vec is None:
-            # Fallback: Hash 64-dim * 12 -> 768-dim
-            temp_dim = 64
-            hash_vec = np.zeros(temp_dim)
-            seed = 0
-            for char in text[-50:]: 
-                seed = (seed * 31 + ord(char)) % (2**32)
-                idx = seed % (temp_dim - 2) + 2
-                val = (seed % 100) / 100.0
-                hash_vec[idx] += val
+            vec = self._hash_embedding(text)
             
-            # Normalize Hash
-            norm = np.linalg.norm(hash_vec)
-            if norm > 0: hash_vec = hash_vec / norm
-            
-            # Tile to 768
-            vec = np.tile(hash_vec, 12) # 64 * 12 = 768
-            
-        # 3. Add Hour Signal (Cyclic) - Mutate first 2 dims
-        # We overlay time context onto the semantic vector
-        angle = (hour / 24.0) * 2 * math.pi
-        vec[0] += math.sin(angle) * 0.1 # Small influence
-        vec[1] += math.cos(angle) * 0.1
-        
-        return vec
+        # 3. Add Hour Signal
+        return self._add_hour_signal(vec, hour)
+
+    def _get_embeddings(self, texts, hour):
+        """ Batched _get_embedding: same vectors, one API round-trip for the whole list """
+        vecs = self._get_embeddings_api(texts)
+        return [
+            self._add_hour_signal(vec if vec is not None else self._hash_embedding(text), hour)
+            for text, vec in zip(texts, vecs)
+        ]
 
     def observe(self, input_text, current_hour):
         """
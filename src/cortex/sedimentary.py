@@ -112,15 +112,21 @@ class SedimentaryCortex:
 
     def learn(self, text, trigger_word, surprise=0.0):
         """ 言葉を大地に埋める (Active Inference Plasticity) """
+        self.learn_batch([text], trigger_word, surprise)
+
+    def learn_batch(self, texts, trigger_word, surprise=0.0):
+        """
+        learn() for many texts under one trigger word (vocabulary injection etc).
+        Coordinates are looked up once, all fragments go in one SQLite transaction,
+        and the pressure/erosion checks run once at the end.
+        """
         # A. 胃袋への情報提供 (Synaptic Networking)
-        self.stomach.eat(text)
+        for text in texts:
+            self.stomach.eat(text)
         
         # B. 大地への埋め込み (Geo-Embedding)
         cx, cy = self.memory.get_coords(trigger_word)
         
-        # 簡易分かち書き
-        fragments = self._shatter_text(text)
-        
         # Plasticity Modulation:
         # High surprise = High variance (Scatter/Trauma)
         # Low surprise = Low variance (Focus/Routine)
@@ -128,28 +134,33 @@ class SedimentaryCortex:
         if surprise > 0.6: base_spread = 40 # Excited/Confused
         if surprise > 0.8: base_spread = 80 # Panic/Chaos
         
-        for frag in fragments:
-            # 中心からばらけさせる
-            off_x = int(random.gauss(0, base_spread))
-            off_y = int(random.gauss(0, base_spread))
-            x, y = max(0, min(self.memory.size, cx + off_x)), max(0, min(self.memory.size, cy + off_y))
-            
-            new_sediment = {
-                "text": frag,
-                "x": x,
-                "y": y,
-                "timestamp": time.time()
-            }
-            
-            # Phase 6: SQLite INSERT
-            self._insert_sediment(new_sediment)
+        size = self.memory.size
+        now = time.time()
+        sediments = []
+        for text in texts:
+            # 簡易分かち書き
+            for frag in self._shatter_text(text):
+                # 中心からばらけさせる
+                off_x = int(random.gauss(0, base_spread))
+                off_y = int(random.gauss(0, base_spread))
+                sediments.append({
+                    "text": frag,
+                    "x": max(0, min(size, cx + off_x)),
+                    "y": max(0, min(size, cy + off_y)),
+                    "timestamp": now
+                })
+        
+        # Phase 6: SQLite INSERT
+        count_before = len(self.all_fragments)
+        self._insert_sediments(sediments)
+        count = len(self.all_fragments)
 
         # Phase 2.2: Metamorphic Pressure (80% Trigger)
-        if len(self.all_fragments) > self.max_sediments * 0.8:
-            # 80%超えたら圧縮を試みる (スロットル: 毎回やると重いので、ランダムか時間制御が必要)
-            # ここではシンプルに毎回チェックするが、compress_memory内でsample_size制限しているのでOK
-            if len(self.all_fragments) % 50 == 0: # 少し間引く
-                print(f"🧱 Metamorphic Pressure rising ({len(self.all_fragments)} sediments). Attempting compression...")
+        if count > self.max_sediments * 0.8:
+            # 80%超えたら圧縮を試みる (スロットル: 毎回やると重いので間引く)
+            # 堆積数が50の倍数をまたいだ時だけ (1件ずつの learn では「% 50 == 0」と同じ)
+            if count // 50 != count_before // 50:
+                print(f"🧱 Metamorphic Pressure rising ({count} sediments). Attempting compression...")
                 self.compress_memory()
 
         # 風化（容量オーバーしたら古いのを消す）
@@ -190,25 +201,32 @@ class SedimentaryCortex:
 
     def _insert_sediment(self, sediment):
         """ Phase 6: SQLiteへの即時INSERT + メモリキャッシュ更新 """
+        self._insert_sediments([sediment])
+
+    def _insert_sediments(self, sediments):
+        """ 複数の堆積物を1トランザクションでINSERT (executemany + 1 commit) """
+        if not sediments:
+            return
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
-            cursor.execute(
+            cursor.executemany(
                 'INSERT INTO sediments (text, x, y, timestamp) VALUES (?, ?, ?, ?)',
-                (sediment.get('text', ''), sediment.get('x', 0), sediment.get('y', 0), sediment.get('timestamp', time.time()))
+                [(s.get('text', ''), s.get('x', 0), s.get('y', 0), s.get('timestamp', time.time())) for s in sediments]
             )
             conn.commit()
             conn.close()
         except Exception as e:
             print(f"⚠️ SQLite Insert Error: {e}")
         
-        # メモリキャッシュも更新
+        # メモリキャッシュも更新 (ロックは1回だけ)
         with self.lock:
-            self.all_fragments.append(sediment)
-            g_key = self._get_grid_key(sediment['x'], sediment['y'])
-            if g_key not in self.spatial_index:
-                self.spatial_index[g_key] = []
-            self.spatial_index[g_key].append(sediment)
+            self.all_fragments.extend(sediments)
+            for sediment in sediments:
+                g_key = self._get_grid_key(sediment['x'], sediment['y'])
+                if g_key not in self.spatial_index:
+                    self.spatial_index[g_key] = []
+                self.spatial_index[g_key].append(sediment)
 
     def speak(self, trigger_word, strategy="RESONATE", tazuna_signal=None):
         """ 発掘作業 (Meta-Cognitive Modulated) """
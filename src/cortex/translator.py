@@ -17,7 +17,7 @@ class MaiaTranslator:
         self.training_lock = threading.Lock() # Init BEFORE first use
         
         # Check and Train
-        if not os.path.exists(self.model.model_path):
+        if not self.model.weights_exist():
             self.train_from_memory()
         else:
             # Load vocab even if model exists
@@ -101,6 +101,11 @@ RETINA_INTERVAL = 0.2
 RETINA_GRID_SIZE = 30  
 RETINA_MOTION_GRID_ROWS = 3
 RETINA_MOTION_GRID_COLS = 3
+RETINA_YOLO_WEIGHTS = "yolov8n.pt"  # Fovea detector (PyTorch weights)
+RETINA_USE_TENSORRT = False  # Opt-in (CUDA): export/load a fixed 640x640 FP16 .engine next to the weights
+                             # (初回起動時の export は数分かかり、その間は中心窩の検出が止まる。既定は PyTorch FP16)
+RETINA_FOVEA_MOTION_GATE = 0.05  # 注視セルの動きがこれ未満ならYOLOを省略 (0.0 = 常に推論)
+RETINA_FOVEA_HOLD_SEC = 3.0      # 物体を見てからこの秒数はゲートしない
 
 # ==========================================
 # 👻 Body & UI Settings
@@ -161,6 +166,20 @@ MC_ATTACK_FACTOR = 2.0              # 攻撃バイアスの係数
 MC_FLEE_FACTOR = 2.0                # 逃走バイアスの係数
 MC_PANIC_DISTANCE = 3.0             # パニックになる敵との距離
 
+# On-demand Planner (Sparse-Reward MDP)
+# 近くの報酬源 (鉱石・原木など) の価値 γ^d * r を比較し、最大のものへ向かう
+MC_PLAN_GAMMA = 0.9                 # 距離1ブロックあたりの割引率
+MC_PLAN_REACH = 1.5                 # この距離以内なら到達済み (GameBrainに委ねる)
+MC_PLAN_TURN_TOLERANCE = 0.5        # 正面とみなす角度差 (rad, bot.jsの1回の旋回量)
+MC_PLAN_MIN_VALUE = 0.5             # これ未満の価値しかなければ計画しない
+MC_PLAN_REWARDS = (                 # (ブロック名に含まれる語, 報酬) 先勝ち
+    ("diamond", 10.0),
+    ("_ore", 5.0),
+    ("chest", 4.0),
+    ("log", 3.0),
+    ("berry", 2.0),
+)
+
 # ==========================================
 # 🔥 Agni (Mentor) Settings (Phase 15.5)
 # ==========================================
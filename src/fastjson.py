@@ -0,0 +1,15 @@
+# src/fastjson.py
+# Fast JSON (optional): orjson reads/writes UTF-8 bytes directly, stdlib json otherwise
+
+import json
+
+try:
+    import orjson
+    loads = orjson.loads  # str / bytes -> object
+    dumps = orjson.dumps  # object -> UTF-8 bytes (compact, non-ASCII kept)
+except ImportError:
+    loads = json.loads
+
+    def dumps(data):
+        """ Same output shape as orjson.dumps: compact UTF-8 bytes, non-ASCII kept """
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
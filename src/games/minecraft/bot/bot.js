@@ -281,6 +281,8 @@ function executeAction(action) {
 }
 
 // HTTP API Server
+const CONNECT_TIMEOUT_MS = 30000;
+
 const server = http.createServer((req, res) => {
     res.setHeader('Content-Type', 'application/json');
     res.setHeader('Access-Control-Allow-Origin', '*');
@@ -312,10 +314,25 @@ const server = http.createServer((req, res) => {
             }
         } else if (url === '/connect' && req.method === 'POST') {
             // POST connect
+            // spawn (または失敗) まで応答を保留し、Python側のポーリングを不要にする
             try {
                 const options = JSON.parse(body);
-                createBot(options);
-                res.end(JSON.stringify({ success: true }));
+                const newBot = createBot(options);
+                let replied = false;
+                const reply = (payload) => {
+                    if (replied) return;
+                    replied = true;
+                    clearTimeout(timer);
+                    res.end(JSON.stringify(payload));
+                };
+                const timer = setTimeout(() => {
+                    reply({ success: true, connected: false });
+                }, CONNECT_TIMEOUT_MS);
+
+                newBot.once('spawn', () => reply({ success: true, connected: true }));
+                newBot.once('error', (err) => reply({ success: false, error: err.message }));
+                newBot.once('kicked', (reason) => reply({ success: false, error: `kicked: ${reason}` }));
+                newBot.once('end', () => reply({ success: false, error: 'disconnected' }));
             } catch (e) {
                 res.end(JSON.stringify({ success: false, error: e.message }));
             }
@@ -337,7 +354,7 @@ server.listen(PORT, () => {
     console.log('   Endpoints:');
     console.log('   - GET  /state     : Get current bot state');
     console.log('   - POST /action    : Execute action');
-    console.log('   - POST /connect   : Connect to server');
+    console.log('   - POST /connect   : Connect to server (responds after spawn)');
     console.log('   - GET  /disconnect: Disconnect bot');
 });
 
@@ -2,10 +2,11 @@
 # ヘッドレスでMinecraft Java版を実行し、強化学習を行う
 
 import time
-import numpy as np
 from typing import Dict, Any, Optional, Tuple
 import threading
 
+from src.games.minecraft.reward_window import RewardWindow
+
 # MineRL is optional - graceful degradation
 try:
     import minerl
@@ -53,8 +54,9 @@ class MinecraftJavaEnv:
             "inventory": {},
         }
         
-        # 学習履歴
-        self.reward_history = []
+        # 学習履歴 (直近1000件の報酬 + 増分統計)
+        self.rewards = RewardWindow(maxlen=1000)
+        self.reward_history = self.rewards.history
         self.action_history = []
         
     def is_available(self) -> bool:
@@ -124,9 +126,7 @@ class MinecraftJavaEnv:
             self._send_reward_to_brain(reward)
         
         # 履歴を保存
-        self.reward_history.append(reward)
-        if len(self.reward_history) > 1000:
-            self.reward_history.pop(0)
+        self.rewards.append(reward)
         
         if done:
             self.episode_count += 1
@@ -246,12 +246,11 @@ class MinecraftJavaEnv:
     
     def get_stats(self) -> Dict[str, Any]:
         """学習統計を取得"""
-        avg_reward = np.mean(self.reward_history) if self.reward_history else 0.0
         return {
             "episodes": self.episode_count,
             "total_steps": self.step_count,
-            "avg_reward": avg_reward,
-            "max_reward": max(self.reward_history) if self.reward_history else 0.0,
+            "avg_reward": self.rewards.mean,
+            "max_reward": self.rewards.max,
         }
 
 
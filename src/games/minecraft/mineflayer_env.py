@@ -6,8 +6,59 @@ import time
 import threading
 import subprocess
 import os
+import math
+import random
 from typing import Dict, Any, Optional, Tuple
 
+import numpy as np
+
+import src.dna.config as config
+from src.body.hormones import Hormone
+from src.games.minecraft.reward_window import RewardWindow
+
+# Brain が無いときのランダム意図 (毎tickのリスト生成を避ける)
+_RANDOM_INTENTS = ("MOVE_FORWARD", "TURN_LEFT", "TURN_RIGHT", "JUMP")
+_RANDOM_MOVE_INTENTS = ("MOVE_FORWARD", "TURN_LEFT", "TURN_RIGHT")
+
+# 探索ボーナス: 訪問済みブロックをチャンク単位 (16x16, 高さ -64..319) のビットグリッドで追跡
+_CHUNK_SIZE = 16
+_WORLD_MIN_Y = -64
+_WORLD_HEIGHT = 384
+EXPLORATION_BONUS = 0.05
+
+# 移動成功/失敗を評価するアクション
+_MOVE_ACTIONS = frozenset(("MOVE_FORWARD", "MOVE_BACK"))
+
+
+def _source_reward(name: str) -> float:
+    """ブロック名から報酬源としての価値を引く (MC_PLAN_REWARDS の先勝ち)"""
+    for keyword, reward in config.MC_PLAN_REWARDS:
+        if keyword in name:
+            return reward
+    return 0.0
+
+
+def _calc_reward_fast(prev_x: float, prev_z: float, new_x: float, new_z: float,
+                      prev_health: float, new_health: float,
+                      is_move_action: bool, has_prev_pos: bool) -> float:
+    """報酬計算の算術部分 (dict を介さずスカラーのみで計算)"""
+    reward = 0.0
+    
+    # 1. 移動報酬（移動できた = 成功）
+    if has_prev_pos and is_move_action:
+        dx = new_x - prev_x
+        dz = new_z - prev_z
+        if dx * dx + dz * dz > 0.01:  # distance > 0.1
+            reward += 0.1  # 移動成功
+        else:
+            reward -= 0.1  # 移動失敗（引っかかった）
+    
+    # 2. 体力ペナルティ
+    if new_health < prev_health:
+        reward -= (prev_health - new_health) * 0.5  # ダメージペナルティ
+    
+    return reward
+
 class MineflayerEnv:
     """
     Mineflayer環境ラッパー。
@@ -37,14 +88,31 @@ class MineflayerEnv:
             "nearbyEntities": [],
         }
         
+        # バックグラウンド状態ポーリング (step が HTTP 往復を待たないように)
+        self._state_lock = threading.Lock()
+        self._pending_events = []  # /state はイベントを排出するので取りこぼさないよう蓄積
+        self._state_thread: Optional[threading.Thread] = None
+        self.state_poll_interval = 0.05
+        
         # 学習統計
         self.step_count = 0
         self.episode_count = 0
         self.total_reward = 0.0
-        self.reward_history = []
+        self.rewards = RewardWindow(maxlen=1000)
+        self.reward_history = self.rewards.history
         
         # 前回の位置（移動検知用）
-        self._last_position = None
+        self._last_pos: Optional[Tuple[float, float, float]] = None
+        
+        # 訪問済みブロック {(cx, cz): bool[16, 384, 16]} (メモリは訪問範囲に比例)
+        self._visited: Dict[Tuple[int, int], np.ndarray] = {}
+        
+        # Phase 11.3: イベント種別 → ハンドラ (dict ディスパッチ)
+        self._event_handlers = {
+            "damage": self._on_damage,
+            "kill": self._on_kill,
+            "error": self._on_error,
+        }
     
     def start_bot_server(self) -> bool:
         """Node.js ボットサーバーを起動"""
@@ -71,17 +139,10 @@ class MineflayerEnv:
                 shell=True
             )
             
-            # サーバー起動を待つ
-            time.sleep(2)
-            
-            # 接続確認
-            try:
-                resp = requests.get(f"{self.api_url}/state", timeout=2)
-                if resp.status_code == 200:
-                    print("✅ Mineflayer server is running!")
-                    return True
-            except:
-                pass
+            # サーバー起動を待つ (/state が応答するまで指数バックオフでポーリング)
+            if self._wait_for_server():
+                print("✅ Mineflayer server is running!")
+                return True
             
             print("⚠️ Server may still be starting...")
             return True
@@ -90,6 +151,24 @@ class MineflayerEnv:
             print(f"❌ Failed to start bot server: {e}")
             return False
     
+    def _wait_for_server(self, timeout: float = 10.0) -> bool:
+        """
+        ボットサーバーの /state が 200 を返すまで待つ。
+        固定スリープではなく、準備ができた時点で即座に戻る。
+        """
+        deadline = time.time() + timeout
+        delay = 0.05
+        while time.time() < deadline:
+            try:
+                resp = requests.get(f"{self.api_url}/state", timeout=0.5)
+                if resp.status_code == 200:
+                    return True
+            except requests.exceptions.RequestException:
+                pass
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.5)
+        return False
+    
     def stop_bot_server(self):
         """ボットサーバーを停止"""
         if self.bot_process:
@@ -109,24 +188,23 @@ class MineflayerEnv:
             username: ボットのユーザー名
         """
         try:
+            # bot.js は spawn (最大30秒) まで応答を保留する
+            print(f"🔗 Bot connecting to {host}:{port} as {username}...")
             resp = requests.post(
                 f"{self.api_url}/connect",
                 json={"host": host, "port": port, "username": username},
-                timeout=10
+                timeout=35
             )
             result = resp.json()
             
             if result.get("success"):
-                print(f"✅ Bot connecting to {host}:{port} as {username}...")
                 self.is_running = True
+                self._start_state_poller()
                 
-                # 接続完了を待つ
-                for _ in range(30):  # 最大30秒待つ
-                    time.sleep(1)
-                    state = self.get_state()
-                    if state.get("connected"):
-                        print("✅ Bot connected to Minecraft!")
-                        return True
+                if result.get("connected"):
+                    self.current_state["connected"] = True
+                    print("✅ Bot connected to Minecraft!")
+                    return True
                 
                 print("⚠️ Connection may still be in progress...")
                 return True
@@ -152,14 +230,52 @@ class MineflayerEnv:
         self.is_running = False
         print("🔌 Bot disconnected.")
     
-    def get_state(self) -> Dict[str, Any]:
-        """現在の状態を取得"""
+    def _start_state_poller(self):
+        """状態ポーリングスレッドを起動 (起動済みなら何もしない)"""
+        if self._state_thread and self._state_thread.is_alive():
+            return
+        self._state_thread = threading.Thread(target=self._state_poller, daemon=True)
+        self._state_thread.start()
+    
+    def _state_poller(self):
+        """/state を一定間隔で取得し、キャッシュを更新する (バックグラウンド)"""
+        while self.is_running:
+            self._fetch_state()
+            time.sleep(self.state_poll_interval)
+    
+    def _fetch_state(self) -> Optional[Dict[str, Any]]:
+        """/state を1回取得してキャッシュへ反映 (取得した状態を返す。失敗時は None)"""
         try:
-            resp = requests.get(f"{self.api_url}/state", timeout=2)
-            self.current_state = resp.json()
-            return self.current_state
-        except:
-            return self.current_state
+            resp = requests.get(f"{self.api_url}/state", timeout=1)
+            state = resp.json()
+        except Exception:
+            return None
+        
+        events = state.pop("events", None)
+        with self._state_lock:
+            if events:
+                self._pending_events.extend(events)
+            self.current_state = state
+        return state
+    
+    def get_state(self, fresh: bool = False) -> Dict[str, Any]:
+        """
+        現在の状態を取得。
+        ポーリングスレッド稼働中はキャッシュのコピーを返す (ネットワーク待ちなし)。
+        fresh=True なら必ずこの場で /state を取得し、その結果を返す
+        (ポーラーのキャッシュは呼び出し前に始まった取得の結果かもしれないため)。
+        未到着のイベントは呼び出し側へ引き渡され、キューから消える。
+        """
+        fetched = None
+        if fresh or not (self._state_thread and self._state_thread.is_alive()):
+            fetched = self._fetch_state()
+        
+        with self._state_lock:
+            # 自分で取得できた状態を優先 (その後に完了した古いポーリングで上書きされていても)
+            state = dict(fetched if fetched is not None else self.current_state)
+            state["events"] = self._pending_events
+            self._pending_events = []
+        return state
     
     def step(self, action: Dict[str, Any]) -> Tuple[Dict, float, bool, Dict]:
         """
@@ -171,9 +287,15 @@ class MineflayerEnv:
         Returns:
             (observation, reward, done, info)
         """
-        # 前の状態を保存
+        # 前の状態を保存 (報酬計算に使う値はここで一度だけ取り出す)
         prev_state = self.get_state()
-        self._last_position = prev_state.get("position", {}).copy()
+        pos = prev_state.get("position") or {}
+        self._last_pos = (
+            (pos.get("x", 0.0), pos.get("y", 0.0), pos.get("z", 0.0)) if pos else None
+        )
+        prev_x, _, prev_z = self._last_pos or (0.0, 0.0, 0.0)
+        prev_health = prev_state.get("health", 20)
+        is_move_action = action.get("type") in _MOVE_ACTIONS
         
         # アクション実行
         try:
@@ -186,12 +308,12 @@ class MineflayerEnv:
         except Exception as e:
             result = {"success": False, "error": str(e)}
         
-        # 少し待ってから状態を取得
+        # 少し待ってから状態を取得 (アクション後に始まった取得の結果で報酬を計算する)
         time.sleep(0.1)
-        new_state = self.get_state()
+        new_state = self.get_state(fresh=True)
         
         # 報酬計算
-        reward = self._calculate_reward(prev_state, new_state, action)
+        reward = self._step_reward(prev_x, prev_z, prev_health, is_move_action, new_state)
         
         # 終了判定
         done = new_state.get("health", 20) <= 0
@@ -199,9 +321,7 @@ class MineflayerEnv:
         # 統計更新
         self.step_count += 1
         self.total_reward += reward
-        self.reward_history.append(reward)
-        if len(self.reward_history) > 1000:
-            self.reward_history.pop(0)
+        self.rewards.append(reward)
         
         # 脳に報酬を送信
         if self.brain and reward != 0:
@@ -211,42 +331,65 @@ class MineflayerEnv:
     
     def _calculate_reward(self, prev_state: Dict, new_state: Dict, 
                           action: Dict) -> float:
-        """報酬計算（内部メソッド）"""
-        reward = 0.0
-        
-        # 1. 移動報酬（移動できた = 成功）
-        if self._last_position:
-            prev_pos = self._last_position
-            new_pos = new_state.get("position", {})
-            
-            dx = new_pos.get("x", 0) - prev_pos.get("x", 0)
-            dz = new_pos.get("z", 0) - prev_pos.get("z", 0)
-            distance = (dx**2 + dz**2) ** 0.5
-            
-            if action.get("type") in ["MOVE_FORWARD", "MOVE_BACK"]:
-                if distance > 0.1:
-                    reward += 0.1  # 移動成功
-                else:
-                    reward -= 0.1  # 移動失敗（引っかかった）
+        """報酬計算（内部メソッド）: 状態 dict から _step_reward を呼ぶ薄いラッパー"""
+        prev_x, _, prev_z = self._last_pos or (0.0, 0.0, 0.0)
+        return self._step_reward(
+            prev_x, prev_z, prev_state.get("health", 20),
+            action.get("type") in _MOVE_ACTIONS, new_state,
+        )
+    
+    def _step_reward(self, prev_x: float, prev_z: float, prev_health: float,
+                     is_move_action: bool, new_state: Dict) -> float:
+        """
+        1ステップの報酬 (step と _calculate_reward の共通部分)。
+        前状態はスカラーで受け取り、新状態から値を取り出して
+        移動/体力の報酬 + 探索ボーナスを計算する。
+        """
+        new_pos = new_state.get("position") or {}
+        new_x = new_pos.get("x", 0)
+        new_z = new_pos.get("z", 0)
         
-        # 2. 体力ペナルティ
-        prev_health = prev_state.get("health", 20)
-        new_health = new_state.get("health", 20)
-        if new_health < prev_health:
-            reward -= (prev_health - new_health) * 0.5  # ダメージペナルティ
+        reward = _calc_reward_fast(
+            prev_x, prev_z, new_x, new_z,
+            prev_health, new_state.get("health", 20),
+            is_move_action, self._last_pos is not None,
+        )
         
         # 3. 探索ボーナス（新しい場所）
-        # TODO: 訪問済み場所の追跡
+        if self._mark_visited(new_x, new_pos.get("y", 64), new_z):
+            reward += EXPLORATION_BONUS
         
         return reward
     
+    def _mark_visited(self, x: float, y: float, z: float) -> bool:
+        """
+        ブロック座標を訪問済みにする。
+        
+        Returns:
+            初めて訪れたブロックなら True
+        """
+        bx, bz = math.floor(x), math.floor(z)
+        ly = math.floor(y) - _WORLD_MIN_Y
+        if not 0 <= ly < _WORLD_HEIGHT:
+            return False
+        
+        key = (bx >> 4, bz >> 4)
+        chunk = self._visited.get(key)
+        if chunk is None:
+            chunk = np.zeros((_CHUNK_SIZE, _WORLD_HEIGHT, _CHUNK_SIZE), dtype=bool)
+            self._visited[key] = chunk
+        
+        lx, lz = bx & 15, bz & 15
+        if chunk[lx, ly, lz]:
+            return False
+        chunk[lx, ly, lz] = True
+        return True
+    
     def _send_reward_to_brain(self, reward: float):
         """報酬を脳に送信"""
         if not self.brain:
             return
         
-        from src.body.hormones import Hormone
-        
         if reward > 0:
             self.brain.hormones.update(Hormone.DOPAMINE, reward * 20)
             self.brain.hormones.update(Hormone.BOREDOM, -5.0)
@@ -285,10 +428,7 @@ class MineflayerEnv:
                     elif self.brain:
                         intent = self._get_intent_from_brain(state)
                     else:
-                        import random
-                        intent = random.choice([
-                            "MOVE_FORWARD", "TURN_LEFT", "TURN_RIGHT", "JUMP"
-                        ])
+                        intent = random.choice(_RANDOM_INTENTS)
                     
                     # 実行
                     action = self.create_action(intent, duration=0.5)
@@ -308,35 +448,17 @@ class MineflayerEnv:
     
     def _get_intent_from_brain(self, state: Dict) -> str:
         """脳からゲーム意図を取得"""
-        import random
-        from src.body.hormones import Hormone
-        
         if not self.brain:
-            return random.choice(["MOVE_FORWARD", "TURN_LEFT", "TURN_RIGHT"])
+            return random.choice(_RANDOM_MOVE_INTENTS)
         
         # Phase 11.3: Event Processing (Feedback Loop)
         events = state.get("events", [])
         if events:
+            handlers = self._event_handlers
             for event in events:
-                evt_type = event.get("type")
-                
-                if evt_type == "damage":
-                    amount = event.get("amount", 1)
-                    print(f"💥 [PAIN] Taken {amount} damage! Cortisol rising.")
-                    self.brain.hormones.update(Hormone.CORTISOL, 10.0 * amount)
-                    self.brain.hormones.update(Hormone.DOPAMINE, -5.0)
-                    
-                elif evt_type == "kill":
-                    mob = event.get("mob", "unknown")
-                    print(f"⚔️ [WIN] Defeated {mob}! Learning success.")
-                    self.brain.hormones.update(Hormone.DOPAMINE, 20.0)
-                    self.brain.hormones.update(Hormone.CORTISOL, -20.0)
-                    # Memory feedback
-                    if hasattr(self.brain, "memory") and hasattr(self.brain.memory, "update_combat_experience"):
-                        self.brain.memory.update_combat_experience(mob, "WIN")
-
-                elif evt_type == "error":
-                    print(f"⚠️ [BOT ERROR] {event.get('message')}")
+                handler = handlers.get(event.get("type"))
+                if handler:
+                    handler(event)
 
         # 1. 座標情報をBrainの空間記憶に送る
         pos_data = state.get("position", {})
@@ -352,12 +474,16 @@ class MineflayerEnv:
         nearby_data = state.get("nearby", [])
         if nearby_data:
             # 負荷軽減のためランダムにサンプリングして渡す
-            import random
             if random.random() < 0.3: # 30%の確率でスキャン
                 for block in nearby_data:
                     self.brain.process_visual_memory(block)
         
-        # 2. GameBrainに次のアクションを決定させる (Phase 11.0: Brain Separation)
+        # 2. 報酬源があればオンデマンド計画で向かう (敵がいなければ)
+        planned = self._plan_intent(state)
+        if planned:
+            return planned
+        
+        # 3. GameBrainに次のアクションを決定させる (Phase 11.0: Brain Separation)
         if not self.minecraft_brain:
             # Lazy Load
             from src.games.minecraft.game_brain import MinecraftBrain
@@ -370,13 +496,78 @@ class MineflayerEnv:
         
         return intent
 
+    def _plan_intent(self, state: Dict) -> Optional[str]:
+        """
+        疎報酬の決定的MDPとしてのオンデマンド方策。
+        
+        価値関数を全状態で解かず、周辺の報酬源ごとに V = γ^d * r を計算して
+        最大の報酬源へ向かう向き (MOVE_FORWARD / TURN_*) を返す。計算量は報酬源の数に比例。
+        敵が近い・報酬源がない・既に到達している場合は None (GameBrainに委ねる)。
+        """
+        mob = state.get("nearestMob")
+        if mob and mob.get("isEnemy"):
+            return None  # 戦闘判断は GameBrain (FEP) に任せる
+        
+        pos = state.get("position")
+        nearby = state.get("nearby")
+        if not pos or not nearby:
+            return None
+        
+        px, pz = pos.get("x", 0), pos.get("z", 0)
+        best_value = config.MC_PLAN_MIN_VALUE
+        best = None
+        for block in nearby:
+            reward = _source_reward(block.get("name", ""))
+            if reward <= 0:
+                continue
+            bpos = block.get("position") or {}
+            # ブロック中心までの水平距離
+            dx = bpos.get("x", 0) + 0.5 - px
+            dz = bpos.get("z", 0) + 0.5 - pz
+            dist = math.hypot(dx, dz)
+            value = (config.MC_PLAN_GAMMA ** dist) * reward
+            if value > best_value:
+                best_value, best = value, (dx, dz, dist)
+        
+        if best is None:
+            return None
+        dx, dz, dist = best
+        if dist <= config.MC_PLAN_REACH:
+            return None  # 到達済み: 掘る/置くなどは GameBrain が決める
+        
+        # Mineflayer の yaw: 0 で -Z 方向、反時計回りに増加 (TURN_LEFT = yaw + 0.5)
+        target_yaw = math.atan2(-dx, -dz)
+        diff = (target_yaw - pos.get("yaw", 0.0) + math.pi) % (2 * math.pi) - math.pi
+        if abs(diff) <= config.MC_PLAN_TURN_TOLERANCE:
+            return "MOVE_FORWARD"
+        return "TURN_LEFT" if diff > 0 else "TURN_RIGHT"
+    
+    def _on_damage(self, event: Dict):
+        """被ダメージイベント: 痛み → コルチゾール上昇"""
+        amount = event.get("amount", 1)
+        print(f"💥 [PAIN] Taken {amount} damage! Cortisol rising.")
+        self.brain.hormones.update(Hormone.CORTISOL, 10.0 * amount)
+        self.brain.hormones.update(Hormone.DOPAMINE, -5.0)
+    
+    def _on_kill(self, event: Dict):
+        """撃破イベント: 成功体験 → ドーパミン + 戦闘記憶"""
+        mob = event.get("mob", "unknown")
+        print(f"⚔️ [WIN] Defeated {mob}! Learning success.")
+        self.brain.hormones.update(Hormone.DOPAMINE, 20.0)
+        self.brain.hormones.update(Hormone.CORTISOL, -20.0)
+        # Memory feedback
+        if hasattr(self.brain, "memory") and hasattr(self.brain.memory, "update_combat_experience"):
+            self.brain.memory.update_combat_experience(mob, "WIN")
+    
+    def _on_error(self, event: Dict):
+        """ボット側エラーの表示"""
+        print(f"⚠️ [BOT ERROR] {event.get('message')}")
+
     def get_stats(self) -> Dict[str, Any]:
         """学習統計を取得"""
-        import numpy as np
-        avg_reward = np.mean(self.reward_history) if self.reward_history else 0.0
         return {
             "episodes": self.episode_count,
             "total_steps": self.step_count,
-            "avg_reward": avg_reward,
-            "max_reward": max(self.reward_history) if self.reward_history else 0.0,
+            "avg_reward": self.rewards.mean,
+            "max_reward": self.rewards.max,
         }
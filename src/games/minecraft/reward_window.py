@@ -0,0 +1,44 @@
+# Reward Window
+# 直近N件の報酬履歴 + 平均/最大値の増分統計 (MineflayerEnv / MinecraftJavaEnv で共有)
+
+from collections import deque
+
+
+class RewardWindow:
+    """
+    直近 maxlen 件の報酬を保持し、合計と最大値を増分更新する。
+    最大値の再計算 (O(N)) は、最大値そのものが窓から押し出された時のみ。
+    """
+
+    def __init__(self, maxlen: int = 1000):
+        self.history = deque(maxlen=maxlen)
+        self._sum = 0.0
+        self._max = float("-inf")
+
+    def __len__(self) -> int:
+        return len(self.history)
+
+    def append(self, reward: float):
+        """報酬を履歴に追加 (満杯なら最古の1件を押し出す)"""
+        history = self.history
+        evicted = None
+        if len(history) == history.maxlen:
+            evicted = history[0]
+            self._sum -= evicted
+
+        history.append(reward)
+        self._sum += reward
+
+        if reward >= self._max:
+            self._max = reward
+        elif evicted is not None and evicted == self._max:
+            self._max = max(history)
+
+    @property
+    def mean(self) -> float:
+        n = len(self.history)
+        return self._sum / n if n else 0.0
+
+    @property
+    def max(self) -> float:
+        return self._max if self.history else 0.0
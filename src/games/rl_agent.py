@@ -7,7 +7,7 @@ import random
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, field
-from collections import deque
+from collections import deque, OrderedDict
 import threading
 
 
@@ -38,9 +38,13 @@ class ReplayBuffer:
             self.buffer.append(exp)
     
     def sample(self, batch_size: int) -> List[Experience]:
-        """ランダムサンプリング"""
+        """ランダムサンプリング (復元抽出、deque をリストへコピーしない)"""
         with self.lock:
-            return random.sample(list(self.buffer), min(batch_size, len(self.buffer)))
+            size = len(self.buffer)
+            if size == 0:
+                return []
+            idx = np.random.randint(0, size, size=min(batch_size, size))
+            return [self.buffer[i] for i in idx]
     
     def __len__(self):
         return len(self.buffer)
@@ -52,15 +56,21 @@ class SimpleQNetwork:
     
     状態をハッシュ化してテーブルで管理。
     小規模なゲームや、PyTorchなしでの動作確認用。
+    
+    Q値は事前確保した (capacity, action_size) の float32 配列に格納し、
+    容量を超えたら最も長く参照されていない状態の行を再利用する (LRU)。
     """
     
-    def __init__(self, action_size: int, learning_rate: float = 0.1):
+    def __init__(self, action_size: int, learning_rate: float = 0.1,
+                 capacity: int = 200_000):
         self.action_size = action_size
         self.lr = learning_rate
-        self.q_table: Dict[str, np.ndarray] = {}
+        self.capacity = capacity
+        self._q = np.zeros((capacity, action_size), dtype=np.float32)
+        self._rows: "OrderedDict[bytes, int]" = OrderedDict()  # 状態キー -> 行番号 (LRU順)
         self.lock = threading.Lock()
     
-    def _state_to_key(self, state: np.ndarray) -> str:
+    def _state_to_key(self, state: np.ndarray) -> bytes:
         """状態をハッシュキーに変換"""
         # 状態を粗く量子化してキーにする
         if state.ndim > 1:
@@ -70,27 +80,40 @@ class SimpleQNetwork:
             small = (state // 32)[:100]
         return small.tobytes()
     
+    def _get_row(self, key: bytes) -> int:
+        """状態キーの行番号を取得（未登録なら割り当て、満杯なら最古を追い出す）。lock 保持中に呼ぶこと"""
+        row = self._rows.get(key)
+        if row is not None:
+            self._rows.move_to_end(key)
+            return row
+        
+        if len(self._rows) >= self.capacity:
+            _, row = self._rows.popitem(last=False)
+            self._q[row] = 0.0
+        else:
+            row = len(self._rows)
+        self._rows[key] = row
+        return row
+    
     def get_q_values(self, state: np.ndarray) -> np.ndarray:
         """Q値を取得"""
         key = self._state_to_key(state)
         with self.lock:
-            if key not in self.q_table:
-                self.q_table[key] = np.zeros(self.action_size)
-            return self.q_table[key].copy()
+            return self._q[self._get_row(key)].copy()
     
     def update(self, state: np.ndarray, action: int, target: float):
         """Q値を更新"""
         key = self._state_to_key(state)
         with self.lock:
-            if key not in self.q_table:
-                self.q_table[key] = np.zeros(self.action_size)
+            q = self._q[self._get_row(key)]
             # TD学習
-            self.q_table[key][action] += self.lr * (target - self.q_table[key][action])
+            q[action] += self.lr * (target - q[action])
     
     def get_state(self) -> Dict:
         """状態を取得"""
         return {
-            "table_size": len(self.q_table),
+            "table_size": len(self._rows),
+            "capacity": self.capacity,
             "learning_rate": self.lr
         }
 
@@ -197,11 +197,9 @@ class BreakoutGame:
         self.ball_dx = random.choice([-1, 1])
         self.ball_dy = -1
         
-        # ブロック
-        self.blocks = set()
-        for y in range(self.blocks_rows):
-            for x in range(self.width):
-                self.blocks.add((y, x))
+        # ブロック (bool グリッド: True = 残存)
+        self._blocks = np.ones((self.blocks_rows, self.width), dtype=bool)
+        self._block_count = self.blocks_rows * self.width
         
         self.score = 0
         self.lives = 3
@@ -221,9 +219,8 @@ class BreakoutGame:
         if 0 <= self.ball_y < self.height and 0 <= self.ball_x < self.width:
             state[int(self.ball_y), int(self.ball_x), 1] = 255
         
-        # ブロック
-        for y, x in self.blocks:
-            state[y, x, 2] = 255
+        # ブロック (ベクトル化書き込み)
+        state[:self.blocks_rows, :, 2] = self._blocks.astype(np.uint8) * 255
         
         return state
     
@@ -259,9 +256,10 @@ class BreakoutGame:
             self.ball_y = 0
         
         # ブロック衝突
-        ball_pos = (int(self.ball_y), int(self.ball_x))
-        if ball_pos in self.blocks:
-            self.blocks.remove(ball_pos)
+        by, bx = int(self.ball_y), int(self.ball_x)
+        if 0 <= by < self.blocks_rows and self._blocks[by, bx]:
+            self._blocks[by, bx] = False
+            self._block_count -= 1
             self.ball_dy *= -1
             self.score += 1
             reward = 1.0
@@ -287,7 +285,7 @@ class BreakoutGame:
                     reward = -0.5
         
         # 全ブロック破壊
-        if not self.blocks:
+        if self._block_count == 0:
             self.done = True
             return self._get_state(), 10.0, True, {"score": self.score, "win": True}
         
@@ -301,7 +299,7 @@ class BreakoutGame:
         for y in range(self.height):
             row = "|"
             for x in range(self.width):
-                if (y, x) in self.blocks:
+                if y < self.blocks_rows and self._blocks[y, x]:
                     row += "#"
                 elif y == self.height - 1 and abs(x - self.paddle_x) <= 1:
                     row += "="
@@ -2,9 +2,14 @@
 import threading
 import time
 import random
-import json
 import os
 import queue
+import re
+
+from src.fastjson import loads as _json_loads  # orjson if installed: parses str/bytes directly
+
+# ```json ... ``` fence around Gemini replies (leading and trailing only)
+_CODEBLOCK_RE = re.compile(r"\A```(?:json)?|```\Z")
 
 # Try importing Gemini API
 try:
@@ -21,31 +26,34 @@ class LeakyBucket:
     def __init__(self, rate_limit_rpm):
         self.capacity = max(1, rate_limit_rpm)
         self.tokens = self.capacity
-        self.last_refill = time.time()
+        self.last_refill = time.monotonic()
         self.rate_per_sec = self.capacity / 60.0 # e.g. 15 / 60 = 0.25 tokens/sec
-        self.lock = threading.Lock()
+        self._cv = threading.Condition()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate_per_sec)
+        self.last_refill = now
 
     def consume(self, cost=1.0, block=True, timeout=10.0):
-        start_wait = time.time()
-        while True:
-            with self.lock:
-                now = time.time()
-                elapsed = now - self.last_refill
-                refill = elapsed * self.rate_per_sec
-                self.tokens = min(self.capacity, self.tokens + refill)
-                self.last_refill = now
-                
+        deadline = time.monotonic() + timeout
+        with self._cv:
+            while True:
+                self._refill()
                 if self.tokens >= cost:
                     self.tokens -= cost
                     return True
-            
-            if not block:
-                return False
-            
-            if time.time() - start_wait > timeout:
-                return False
                 
-            time.sleep(1.0) # Wait for refill
+                if not block:
+                    return False
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                
+                # Sleep exactly until enough tokens have refilled
+                need = (cost - self.tokens) / self.rate_per_sec
+                self._cv.wait(timeout=min(need, remaining))
 
 class AgniAccelerator:
     """ 
@@ -122,11 +130,9 @@ class AgniAccelerator:
         try:
             response = self.model.generate_content(prompt)
             # Cleanup JSON
-            text = response.text.strip()
-            if text.startswith("```json"): text = text[7:]
-            if text.endswith("```"): text = text[:-3]
+            text = _CODEBLOCK_RE.sub("", response.text.strip())
             
-            data = json.loads(text)
+            data = _json_loads(text)
             # Force add source tag logic
             data["source_entity"] = f"{config.SOURCE_AGNI}_{self.current_persona}"
             
@@ -1,5 +1,8 @@
 import time
 import threading
+from types import MappingProxyType
+import numpy as np
+from src.body.hormones import Hormone
 # Phase 6.5: Import config from DNA
 try:
     import src.dna.config as config
@@ -11,8 +14,8 @@ except ImportError:
 # "Converts 30fps frames into Geological Sediments"
 # ==========================================
 class VisualMemoryBridge:
-    # Shared Translation Map (YOLO -> Japanese)
-    YOLO_TO_JP = {
+    # Shared Translation Map (YOLO -> Japanese), read-only across threads
+    YOLO_TO_JP = MappingProxyType({
         "person": "人", "bicycle": "自転車", "car": "車", "motorcycle": "バイク",
         "airplane": "飛行機", "bus": "バス", "train": "電車", "truck": "トラック",
         "boat": "ボート", "traffic light": "信号機", "bird": "鳥", "cat": "猫",
@@ -35,17 +38,24 @@ class VisualMemoryBridge:
         "refrigerator": "冷蔵庫", "book": "本", "clock": "時計", "vase": "花瓶",
         "scissors": "ハサミ", "teddy bear": "テディベア", "hair drier": "ドライヤー",
         "toothbrush": "歯ブラシ"
-    }
+    })
+    
+    # Reverse Map for Active Inference (Japanese -> YOLO), built once at class load
+    JP_TO_YOLO = MappingProxyType({v: k for k, v in YOLO_TO_JP.items()})
+    
+    # Bound lookup (skips the attribute chain in translate_tag)
+    _yolo_to_jp = YOLO_TO_JP.get
+
+    # Fixed hormone order for the emotion vector (index <-> name)
+    HORMONES = tuple(h.value for h in Hormone)
+    HORMONE_IDX = MappingProxyType({name: i for i, name in enumerate(HORMONES)})
 
     def __init__(self, memory, cortex):
         self.memory = memory # GeologicalMemory
         self.cortex = cortex # SedimentaryCortex
         self.current_focus = None
         self.focus_start_time = 0
-        self.accumulated_emotion = {}
-        
-        # Reverse Map for Active Inference (Japanese -> YOLO)
-        self.JP_TO_YOLO = {v: k for k, v in self.YOLO_TO_JP.items()}
+        self.accumulated_emotion = np.zeros(len(self.HORMONES), dtype=np.float32)
         
         # Debounce Buffer
         self.pending_focus = None
@@ -53,6 +63,10 @@ class VisualMemoryBridge:
         self.persistence_threshold = 0.5 # New focus must be stable for 0.5s
         self.lock = threading.Lock() # Thread Safety
         
+        # ConceptLearner 翻訳キャッシュ (既知タグのみ: 未知→学習済みへの昇格を取りこぼさない)
+        # YOLO has ~80 classes, so this stays tiny
+        self._translate_cache = {}
+        
         # Reference to Senses (Injected later or via Brain)
         self.senses = None 
 
@@ -77,9 +91,17 @@ class VisualMemoryBridge:
             # Concept is abstract (e.g. "Peace"), cannot look for it with YOLO.
             pass
 
+    @classmethod
+    def _dict_to_vec(cls, chemicals):
+        """ {"dopamine": 50.0, ...} -> float32 vector in HORMONES order (ndarray passes through) """
+        if isinstance(chemicals, np.ndarray):
+            return chemicals
+        get = chemicals.get
+        return np.fromiter((get(h, 0.0) for h in cls.HORMONES), dtype=np.float32, count=len(cls.HORMONES))
+
     def translate_tag(self, tag):
         """ Translate English YOLO tag to Japanese """
-        return self.YOLO_TO_JP.get(tag, tag)
+        return self._yolo_to_jp(tag, tag)
 
     def flush(self):
         """ Force commit current focus (for Shutdown) """
@@ -96,8 +118,9 @@ class VisualMemoryBridge:
         """
         毎フレーム呼び出されるが、記憶への書き込みは「注目対象が変わった時」だけ行う
         detected_objects_en: List of English strings (from sct/YOLO)
-        current_chemicals: Dict of hormones
+        current_chemicals: Dict of hormones (or a vector in HORMONES order)
         """
+        cur = self._dict_to_vec(current_chemicals)
         with self.lock:
             # 最も優先度の高い物体を特定
             primary_obj = detected_objects_en[0] if detected_objects_en else None
@@ -118,30 +141,35 @@ class VisualMemoryBridge:
                     
                     self.current_focus = primary_obj
                     self.focus_start_time = now
-                    self.accumulated_emotion = current_chemicals.copy()
+                    np.copyto(self.accumulated_emotion, cur)
                     self.pending_focus = None
             else:
                 self.pending_focus = None
-                for chem, val in current_chemicals.items():
-                    if val > self.accumulated_emotion.get(chem, 0):
-                        self.accumulated_emotion[chem] = val
+                # 注目中の感情ピークを保持 (element-wise max, in place)
+                np.maximum(self.accumulated_emotion, cur, out=self.accumulated_emotion)
 
     def _commit_memory(self, obj_name_en, duration, emotions):
         """
         地質学的記憶へ書き込み
         Phase 6: ConceptLearner でハイブリッド学習
         """
+        emotions = self._dict_to_vec(emotions)
+        idx = self.HORMONE_IDX
+        
         # 感情の最大成分を抽出
         dominant_emotion = "neutral"
-        if emotions:
-            dominant_emotion = max(emotions, key=emotions.get)
+        intensity = 0.0
+        if emotions.any():
+            dominant_idx = int(emotions.argmax())
+            dominant_emotion = self.HORMONES[dominant_idx]
+            intensity = float(emotions[dominant_idx])
         
         # 化石化 (Fossilization) - 好き嫌いの形成
         valence_delta = 0.0
         # Phase 6: 0-100 スケールに対応
-        if emotions.get("oxytocin", 0) > 60.0 or emotions.get("dopamine", 0) > 60.0:
+        if emotions[idx["oxytocin"]] > 60.0 or emotions[idx["dopamine"]] > 60.0:
             valence_delta = 0.1
-        elif emotions.get("cortisol", 0) > 50.0:
+        elif emotions[idx["cortisol"]] > 50.0:
             valence_delta = -0.1
         
         # Phase 6: ConceptLearner を使って翻訳
@@ -154,7 +182,13 @@ class VisualMemoryBridge:
             brain = self.memory._parent_brain
         
         if brain and hasattr(brain, 'concept_learner'):
-            jp_name, is_known = brain.concept_learner.translate(obj_name_en)
+            cached = self._translate_cache.get(obj_name_en)
+            if cached is not None:
+                jp_name, is_known = cached
+            else:
+                jp_name, is_known = brain.concept_learner.translate(obj_name_en)
+                if is_known:
+                    self._translate_cache[obj_name_en] = (jp_name, is_known)
             
             if not is_known:
                 # 未知の物体 → 感情と共に一時記憶
@@ -185,7 +219,7 @@ class VisualMemoryBridge:
             "meta": {
                 "duration": round(duration, 1),
                 "emotion_tag": dominant_emotion,
-                "intensity": emotions.get(dominant_emotion, 0),
+                "intensity": intensity,
                 "is_known": is_known
             }
         }
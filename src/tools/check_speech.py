@@ -17,15 +17,15 @@ def check_speech():
     
     words = ["空", "海", "楽しい", "未来", "家"]
     
+    # Get Vectors from Prediction Engine (one batched call)
+    if hasattr(brain, 'prediction_engine'):
+         vecs = brain.prediction_engine._get_embeddings(words, 0) # 0 context
+    else:
+         print("⚠️ No Prediction Engine")
+         vecs = [None] * len(words)
+    
     print("\n--- Generating 5 Sentences ---")
-    for i, word in enumerate(words):
-        # Get Vector from Prediction Engine
-        if hasattr(brain, 'prediction_engine'):
-             vec = brain.prediction_engine._get_embedding(word, 0) # 0 context
-        else:
-             print("⚠️ No Prediction Engine")
-             vec = None
-             
+    for word, vec in zip(words, vecs):
         if vec is not None:
             sentence = brain.language_center.speak(vec, valence_state=0.5, trigger_source="IMPULSE")
             print(f"[{word}] {sentence}")
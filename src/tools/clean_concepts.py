@@ -1,38 +1,45 @@
 
-import json
 import os
+import sys
+
+# Setup Paths (standalone execution: python src/tools/clean_concepts.py)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BASE_DIR not in sys.path:
+    sys.path.append(BASE_DIR)
+
+from src.fastjson import loads as _loads, dumps as _dumps
 
 PATH = "memory_data/brain_concepts.json"
 
+def _is_junk(key):
+    """ Overlong keys, or sentence fragments containing the bot's own name """
+    return len(key) > 15 or ("カナメ" in key and len(key) > 5)
+
 def clean():
     if not os.path.exists(PATH):
         print("No concepts file.")
         return
 
-    with open(PATH, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(PATH, 'rb') as f:
+        data = _loads(f.read())
     
     concepts = data.get("concepts", {})
-    to_delete = []
 
     print(f"Total concepts: {len(concepts)}")
     
-    for key in concepts.keys():
-        if len(key) > 15:
-            print(f"Detecting junk key: {key}")
-            to_delete.append(key)
-        if "カナメ" in key and len(key) > 5:
-             print(f"Detecting target junk: {key}")
-             to_delete.append(key)
-
-    for key in to_delete:
-        del concepts[key]
-        print(f"Deleted: {key}")
-    
-    data["concepts"] = concepts
+    # Single pass: rebuild a compact dict instead of scan + del
+    kept = {k: v for k, v in concepts.items() if not _is_junk(k)}
+    deleted = len(concepts) - len(kept)
+
+    if not deleted:
+        print("Nothing to clean.")
+        return # No rewrite when nothing changed
+
+    print(f"Deleted {deleted} junk keys.")
+    data["concepts"] = kept
     
-    with open(PATH, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False)
+    with open(PATH, 'wb') as f:
+        f.write(_dumps(data))
     
     print("Concepts cleaned.")
 
@@ -1,9 +1,16 @@
 
 import os
-import json
+import sys
 import shutil
 import time
 
+# Setup Paths (standalone execution: python src/tools/clean_memory_tags.py)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BASE_DIR not in sys.path:
+    sys.path.append(BASE_DIR)
+
+from src.fastjson import loads as _loads, dumps as _dumps
+
 # Defined in brain.py, copied here for standalone execution
 YOLO_TO_JP = {
     "person": "人", "bicycle": "自転車", "car": "車", "motorcycle": "バイク",
@@ -29,6 +36,22 @@ YOLO_TO_JP = {
     "scissors": "ハサミ", "teddy bear": "テディベア", "hair drier": "ドライヤー",
     "toothbrush": "歯ブラシ"
 }
+_ENGLISH_TAGS = frozenset(YOLO_TO_JP)
+
+
+def _file_signature(path):
+    """ mtime_ns:size - changes whenever the file is rewritten """
+    st = os.stat(path)
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _write_signature(sig_path, sig):
+    """ Atomic write (tmp + replace) so a crash never leaves a half-written signature """
+    tmp_path = sig_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(sig)
+    os.replace(tmp_path, sig_path)
+
 
 def clean_memory():
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -38,6 +61,17 @@ def clean_memory():
         print(f"❌ Target not found: {target_path}")
         return
 
+    # 0. Fast exit: unchanged since the last clean -> nothing to parse or rewrite
+    sig_path = target_path + ".cleanstat"
+    sig = _file_signature(target_path)
+    try:
+        with open(sig_path, "r", encoding="utf-8") as f:
+            if f.read() == sig:
+                print("✨ Memory unchanged since last clean. Skipping.")
+                return
+    except OSError:
+        pass
+
     print(f"🧹 Scanning memory: {target_path}")
     
     # 1. Backup
@@ -47,32 +81,29 @@ def clean_memory():
     
     # 2. Load
     try:
-        with open(target_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(target_path, "rb") as f:
+            data = _loads(f.read())
             concepts = data.get("concepts", {})
     except Exception as e:
         print(f"❌ Load error: {e}")
         return
 
     # 3. Clean
-    removed = []
-    english_tags = set(YOLO_TO_JP.keys())
-    
-    # Iterate safely
-    current_keys = list(concepts.keys())
-    for key in current_keys:
-        if key in english_tags:
-            del concepts[key]
-            removed.append(key)
+    removed = [key for key in concepts if key in _ENGLISH_TAGS]
+    for key in removed:
+        del concepts[key]
             
     # 4. Save
     if removed:
         print(f"🗑️ Removing {len(removed)} English tags: {', '.join(removed)}")
-        with open(target_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False)
+        with open(target_path, "wb") as f:
+            f.write(_dumps(data))
         print("✅ Cleaned memory saved.")
+        sig = _file_signature(target_path)
     else:
         print("✨ No English tags found. Memory is clean.")
+    
+    _write_signature(sig_path, sig)
 
 if __name__ == "__main__":
     clean_memory()
@@ -1,10 +1,33 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import ast
 import json
 import os
 import threading
 import src.dna.config as config
 
+def _scan_config():
+    """ Editable config keys in display order (reflection runs once per process, not per open) """
+    # Filter Logic
+    items = []
+    for key in dir(config):
+        if key.startswith("_"): continue
+        # Exclude imports and system paths
+        if key in ["os", "json", "load_dotenv", "BASE_DIR", "MEMORY_DIR", "TEMP_DIR", "USER_CONFIG_PATH", "load_user_config", "threading", "Enum", "auto", "Dict", "Tuple"]: continue
+        
+        val = getattr(config, key)
+        if callable(val): continue
+        if isinstance(val, (type, threading.Lock.__class__)): continue
+        if str(type(val)) == "<class 'module'>": continue
+        
+        items.append((key, val))
+        
+    # Sort: Booleans first (User Request), then others (alphabetical)
+    items.sort(key=lambda x: (not isinstance(x[1], bool), x[0]))
+    return tuple(key for key, _ in items)
+
+_EDITABLE_KEYS = _scan_config()
+
 class ConfigEditor(tk.Toplevel):
     def __init__(self, parent):
         super().__init__(parent)
@@ -13,27 +36,33 @@ class ConfigEditor(tk.Toplevel):
         self.config(bg="black")
         
         # --- Data Prep ---
-        self.vars = {} # {key: tk.Variable}
+        self.values = {} # {key: str} (edited text, cast back on save)
         self.initial_types = {} # {key: type}
+        self._editor = None # In-place Entry overlay (one at a time)
         
         # --- UI Layout ---
+        # Single Treeview: native drawing of visible rows only (no per-key Python widgets)
+        style = ttk.Style(self)
+        style.configure("Config.Treeview", background="black", fieldbackground="black", foreground="white", font=("Consolas", 9))
+        style.configure("Config.Treeview.Heading", font=("MS Gothic", 9))
+        
         self.mainframe = tk.Frame(self, bg="black")
         self.mainframe.pack(fill="both", expand=True)
 
-        self.canvas = tk.Canvas(self.mainframe, bg="black", highlightthickness=0)
-        self.scrollbar = ttk.Scrollbar(self.mainframe, orient="vertical", command=self.canvas.yview)
-        self.scroll_frame = tk.Frame(self.canvas, bg="black")
-        
-        self.scroll_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-        self.canvas.create_window((0, 0), window=self.scroll_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.tree = ttk.Treeview(self.mainframe, columns=("value",), show="tree headings", style="Config.Treeview")
+        self.tree.heading("#0", text="Key")
+        self.tree.heading("value", text="Value")
+        self.tree.column("#0", width=250, anchor="w")
+        self.tree.column("value", width=180, anchor="w")
+        self.scrollbar = ttk.Scrollbar(self.mainframe, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
         
-        self.canvas.pack(side="left", fill="both", expand=True)
+        self.tree.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
         
+        # Double-click: bool toggles, others open an Entry over the cell
+        self.tree.bind("<Double-1>", self._on_double_click)
+        
         # Populate
         self._load_configs()
         
@@ -43,75 +72,69 @@ class ConfigEditor(tk.Toplevel):
         
         tk.Button(btn_frame, text="保存 (Save)", command=self._save, bg="#444", fg="white", font=("MS Gothic", 10)).pack(side="left", padx=20, expand=True)
         tk.Button(btn_frame, text="リセット (Reset)", command=self._reset, bg="#822", fg="white", font=("MS Gothic", 10)).pack(side="right", padx=20, expand=True)
-        
-        # Mouse Wheel support
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-
-    def _on_mousewheel(self, event):
-        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
 
     def _load_configs(self):
-        row = 0
-        
-        # Filter Logic
-        items = []
-        for key in dir(config):
-            if key.startswith("_"): continue
-            # Exclude imports and system paths
-            if key in ["os", "json", "load_dotenv", "BASE_DIR", "MEMORY_DIR", "TEMP_DIR", "USER_CONFIG_PATH", "load_user_config", "threading", "Enum", "auto", "Dict", "Tuple"]: continue
-            
+        for key in _EDITABLE_KEYS:
             val = getattr(config, key)
-            if callable(val): continue
-            if isinstance(val, (type, threading.Lock.__class__)): continue
-            if str(type(val)) == "<class 'module'>": continue
-            
-            items.append((key, val))
-            
-        # Sort: Booleans first (User Request), then others (alphabetical)
-        items.sort(key=lambda x: (not isinstance(x[1], bool), x[0]))
-
-        for key, val in items:
             self.initial_types[key] = type(val)
-            
-            # Row Container
-            frame = tk.Frame(self.scroll_frame, bg="black")
-            frame.pack(fill="x", padx=10, pady=2)
-            
-            # Label
-            lbl = tk.Label(frame, text=key, fg="#aaa", bg="black", width=30, anchor="w", font=("Consolas", 9))
-            lbl.pack(side="left")
-            
-            # Input
-            if isinstance(val, bool):
-                var = tk.BooleanVar(value=val)
-                cb = tk.Checkbutton(frame, variable=var, bg="black", activebackground="black", selectcolor="#444")
-                cb.pack(side="left")
-                self.vars[key] = var
-            elif isinstance(val, (int, float)):
-                # Use Entry for numbers
-                var = tk.DoubleVar(value=val) if isinstance(val, float) else tk.IntVar(value=val)
-                entry = tk.Entry(frame, textvariable=var, bg="#222", fg="white", insertbackground="white", width=20)
-                entry.pack(side="left", fill="x", expand=True)
-                self.vars[key] = var
-            else:
-                try:
-                    # Generic String fallback (list/dict/str)
-                    var = tk.StringVar(value=str(val))
-                    entry = tk.Entry(frame, textvariable=var, bg="#222", fg="white", insertbackground="white", width=20)
-                    entry.pack(side="left", fill="x", expand=True)
-                    self.vars[key] = var
-                except:
-                    # Cannot serialize
-                    pass
+            self.values[key] = str(val)
+            self.tree.insert("", "end", iid=key, text=key, values=(self.values[key],))
+
+    def _on_double_click(self, event):
+        key = self.tree.identify_row(event.y)
+        if not key:
+            return
+        self._close_editor(commit=True)
+        
+        # Bool: toggle in place (Checkbutton equivalent)
+        if self.initial_types[key] is bool:
+            self._set_value(key, "False" if self.values[key] == "True" else "True")
+            return
+        
+        bbox = self.tree.bbox(key, "value")
+        if not bbox:
+            return
+        x, y, w, h = bbox
+        entry = tk.Entry(self.tree, bg="#222", fg="white", insertbackground="white")
+        entry.insert(0, self.values[key])
+        entry.select_range(0, "end")
+        entry.place(x=x, y=y, width=w, height=h)
+        entry.focus_set()
+        entry.bind("<Return>", lambda e: self._close_editor(commit=True))
+        entry.bind("<FocusOut>", lambda e: self._close_editor(commit=True))
+        entry.bind("<Escape>", lambda e: self._close_editor(commit=False))
+        self._editor = (key, entry)
+
+    def _close_editor(self, commit):
+        if self._editor is None:
+            return
+        key, entry = self._editor
+        self._editor = None
+        if commit:
+            self._set_value(key, entry.get())
+        entry.destroy()
+
+    def _set_value(self, key, text):
+        self.values[key] = text
+        self.tree.set(key, "value", text)
+
+    def _cast(self, key, text):
+        """ Edited text -> original type (containers via literal_eval) """
+        t = self.initial_types[key]
+        if t is bool:
+            return text == "True"
+        if t in (int, float, str):
+            return t(text)
+        return ast.literal_eval(text)
 
     def _save(self):
+        self._close_editor(commit=True)
         updates = {}
         error_list = []
         
-        for key, var in self.vars.items():
+        for key, text in self.values.items():
             try:
-                val = var.get()
-                updates[key] = val
+                updates[key] = self._cast(key, text)
             except Exception as e:
                 error_list.append(f"{key}: {e}")
         
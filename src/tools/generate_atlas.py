@@ -1,17 +1,67 @@
 
 import os
 import ast
+import json
 import inspect
 import importlib.util
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 # Target Directories
 SRC_DIR = "src"
 OUTPUT_FILE = os.path.join("docs", "FUNCTION_ATLAS.md")
+CACHE_PATH = os.path.join("docs", ".atlas_cache.json")
+CACHE_VERSION = 2 # Bump whenever parse_file's output changes (invalidates every entry)
+
+def _file_signature(filepath):
+    """ mtime_ns:size - changes whenever the file is rewritten """
+    st = os.stat(filepath)
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+def load_cache():
+    """ {filepath: {"sig": str, "structure": list}} from the previous run """
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("files", {})
+
+def save_cache(cache):
+    try:
+        with open(CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "files": cache}, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"⚠️ Atlas cache not saved: {e}")
+
+def _has_defs(filepath):
+    """ Cheap byte scan: can this file contain a top-level def/class? (False -> skip ast.parse) """
+    with open(filepath, "rb") as f:
+        head = f.read()
+    return head.startswith((b"def ", b"class ")) or b"\ndef " in head or b"\nclass " in head
+
+def _parse_safe(filepath):
+    """ Worker entry: (structure, None) or (None, error message) - exceptions never cross the pool """
+    try:
+        return parse_file(filepath), None
+    except Exception as e:
+        return None, str(e)
 
 def get_function_signature(node):
     """
     Reconstruct function signature/arguments from AST node.
+    ast.unparse (Python 3.9+) covers annotations, kw-only and positional-only args.
+    """
+    try:
+        return f"({ast.unparse(node.args)})"
+    except AttributeError:
+        return _legacy_signature(node)
+
+def _legacy_signature(node):
+    """
+    Pre-3.9 fallback: positional args, simple defaults, *args/**kwargs only.
     """
     args = []
     defaults = dict()
@@ -39,6 +89,17 @@ def get_function_signature(node):
         
     return f"({', '.join(args)})"
 
+def _get_doc(node):
+    """
+    Raw docstring of a def/class body (or None).
+    Like ast.get_docstring without the cleandoc pass: the atlas only uses .strip()'s first line.
+    """
+    if node.body:
+        first = node.body[0]
+        if isinstance(first, ast.Expr) and isinstance(first.value, ast.Constant) and isinstance(first.value.value, str):
+            return first.value.value
+    return None
+
 def parse_file(filepath):
     """
     Parse a python file and return structure.
@@ -53,12 +114,12 @@ def parse_file(filepath):
             class_info = {
                 "type": "class",
                 "name": node.name,
-                "doc": ast.get_docstring(node),
+                "doc": _get_doc(node),
                 "methods": []
             }
             for item in node.body:
                 if isinstance(item, ast.FunctionDef):
-                    method_doc = ast.get_docstring(item)
+                    method_doc = _get_doc(item)
                     sig = get_function_signature(item)
                     class_info["methods"].append({
                         "name": item.name,
@@ -68,7 +129,7 @@ def parse_file(filepath):
             structure.append(class_info)
             
         elif isinstance(node, ast.FunctionDef):
-            func_doc = ast.get_docstring(node)
+            func_doc = _get_doc(node)
             sig = get_function_signature(node)
             structure.append({
                 "type": "function",
@@ -85,66 +146,101 @@ def generate_atlas():
     """
     print(f"🗺️ Generating Atlas from {SRC_DIR}...")
     
-    lines = []
-    lines.append(f"# 🗺️ 機能アトラス (FUNCTION ATLAS)")
-    lines.append(f"> **生成日時**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"> **ソース**: `{SRC_DIR}/`")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-
-    # Walk through directories
+    # 1. Collect files (walk order = atlas order)
+    sections = []
     for root, dirs, files in os.walk(SRC_DIR):
         py_files = [f for f in files if f.endswith(".py") and f != "__init__.py"]
+        if py_files:
+            sections.append((os.path.relpath(root, "."), [(f, os.path.join(root, f)) for f in py_files]))
+    all_paths = [fp for _, entries in sections for _, fp in entries]
+
+    # 2. Parse cache (unchanged files skip ast.parse)
+    cache = load_cache()
+    results = {}
+    misses = []
+    for filepath in all_paths:
+        sig = _file_signature(filepath)
+        entry = cache.get(filepath)
+        if entry and entry.get("sig") == sig:
+            results[filepath] = (entry["structure"], None)
+        elif not _has_defs(filepath):
+            results[filepath] = ([], None) # Constants/imports only: "no public defs" without parsing
+            cache[filepath] = {"sig": sig, "structure": []}
+        else:
+            misses.append((filepath, sig))
+
+    # 3. Parse the rest in parallel (independent files, CPU-bound ast.parse)
+    if misses:
+        print(f"  Parsing {len(misses)} changed files ({len(all_paths) - len(misses)} cached)...")
+        with ProcessPoolExecutor() as ex:
+            parsed = ex.map(_parse_safe, [fp for fp, _ in misses], chunksize=8)
+            for (filepath, sig), (structure, error) in zip(misses, parsed):
+                results[filepath] = (structure, error)
+                if error is None:
+                    cache[filepath] = {"sig": sig, "structure": structure}
+
+    # 4. Stream to file in walk order (no full-document list/join in memory)
+    with open(OUTPUT_FILE, "w", encoding="utf-8", buffering=1 << 16) as out:
+        _write_atlas(out.write, sections, results)
+    
+    # Drop deleted files from the cache, then persist it
+    save_cache({k: cache[k] for k in all_paths if k in cache})
         
-        if not py_files:
-            continue
-            
+    print(f"✅ Atlas Generated: {OUTPUT_FILE}")
+
+def _write_atlas(write, sections, results):
+    """
+    Emit the atlas markdown line by line through write().
+    """
+    def emit(line):
+        write(line)
+        write("\n")
+
+    emit(f"# 🗺️ 機能アトラス (FUNCTION ATLAS)")
+    emit(f"> **生成日時**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    emit(f"> **ソース**: `{SRC_DIR}/`")
+    emit("")
+    emit("---")
+    emit("")
+
+    for rel_dir, entries in sections:
         # Section Header (Directory)
-        rel_dir = os.path.relpath(root, ".")
-        lines.append(f"## 📁 `{rel_dir}`")
+        emit(f"## 📁 `{rel_dir}`")
         
-        for file in py_files:
-            filepath = os.path.join(root, file)
-            print(f"  Parsing {file}...")
-            
-            lines.append(f"### 📄 `{file}`")
+        for file, filepath in entries:
+            emit(f"### 📄 `{file}`")
             
             try:
-                items = parse_file(filepath)
+                items, error = results[filepath]
+                if error is not None:
+                    raise SyntaxError(error)
                 if not items:
-                    lines.append("*公開定義が見つかりません。*")
-                    lines.append("")
+                    emit("*公開定義が見つかりません。*")
+                    emit("")
                     continue
                 
                 for item in items:
                     if item["type"] == "class":
                         doc = item["doc"].strip().split('\n')[0] if item["doc"] else ""
-                        lines.append(f"- **class {item['name']}**")
-                        if doc: lines.append(f"  - 📝 *{doc}*")
+                        emit(f"- **class {item['name']}**")
+                        if doc: emit(f"  - 📝 *{doc}*")
                         
                         for method in item["methods"]:
                             if method["name"].startswith("_") and method["name"] != "__init__":
                                 continue # Skip private methods for atlas (unless important?)
                             
                             mdoc = method["doc"].strip().split('\n')[0] if method["doc"] else ""
-                            lines.append(f"  - `def {method['name']}{method['signature']}`")
+                            emit(f"  - `def {method['name']}{method['signature']}`")
                     
                     elif item["type"] == "function":
                         doc = item["doc"].strip().split('\n')[0] if item["doc"] else ""
-                        lines.append(f"- **def {item['name']}{item['signature']}**")
-                        if doc: lines.append(f"  - 📝 *{doc}*")
+                        emit(f"- **def {item['name']}{item['signature']}**")
+                        if doc: emit(f"  - 📝 *{doc}*")
             
-                lines.append("")
+                emit("")
             except Exception as e:
-                lines.append(f"⚠️ *Parse Error: {e}*")
-                lines.append("")
-
-    # Write to file
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
-        
-    print(f"✅ Atlas Generated: {OUTPUT_FILE}")
+                emit(f"⚠️ *Parse Error: {e}*")
+                emit("")
 
 if __name__ == "__main__":
     generate_atlas()
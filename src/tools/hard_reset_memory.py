@@ -1,70 +1,95 @@
 
 import os
-import json
-import sqlite3
+import sys
 import glob
 
+# Setup Paths (standalone execution: python src/tools/hard_reset_memory.py)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BASE_DIR not in sys.path:
+    sys.path.append(BASE_DIR)
+
+from src.fastjson import loads as _loads, dumps as _dumps
+
 MEMORY_DIR = "memory_data"
 
+# Files wiped by a hard reset (tuple: deletion/log order)
+RESET_TARGETS = (
+    "brain_sediments.db",
+    "brain_sediments.json",
+    "brain_sediments.json.migrated",
+    "brain_stomach_data.json", # Synaptic Stomach
+    "digestion_log.json",
+    "brain_combat.json",
+    # HDC (Soul) Files - The Zombie hides here!
+    "brain_hashes.pkl",
+    "brain_terrain.npy",
+    "rnn_vocab.json",
+)
+
+# Zombie Phrase markers (UTF-8, as written by memory.py / orjson)
+_ZOMBIE_MARKERS = ("カナメ".encode("utf-8"), "良い子".encode("utf-8"))
+
+def _is_zombie(key):
+    """ Keys that look like sentences: too long, or containing the bot's name / praise blobs """
+    return len(key) > 15 or ("カナメ" in key and len(key) > 6) or "良い子" in key
+
 def hard_reset():
     print("🧹 STARTING HARD MEMORY RESET (EXORCISM) 🧹")
     
     # 1. Delete Sediments (Short Term Memory / Conversation Logs)
-    targets = [
-        "brain_sediments.db",
-        "brain_sediments.json",
-        "brain_sediments.json.migrated",
-        "brain_stomach_data.json", # Synaptic Stomach
-        "digestion_log.json",
-        "brain_combat.json",
-        # HDC (Soul) Files - The Zombie hides here!
-        "brain_hashes.pkl",
-        "brain_terrain.npy",
-        "rnn_vocab.json"
-    ]
+    # One directory listing instead of exists() + remove() per target
+    try:
+        with os.scandir(MEMORY_DIR) as it:
+            present = {entry.name for entry in it}
+    except FileNotFoundError:
+        present = set()
     
-    for t in targets:
-        path = os.path.join(MEMORY_DIR, t)
-        if os.path.exists(path):
-            try:
-                os.remove(path)
-                print(f"✅ Deleted: {t}")
-            except Exception as e:
-                print(f"❌ Failed to delete {t}: {e} (Is Kaname still running?)")
+    for t in RESET_TARGETS:
+        if t not in present:
+            continue
+        try:
+            os.unlink(os.path.join(MEMORY_DIR, t))
+            print(f"✅ Deleted: {t}")
+        except FileNotFoundError:
+            pass # Vanished since the listing
+        except Exception as e:
+            print(f"❌ Failed to delete {t}: {e} (Is Kaname still running?)")
     
     # 2. Clean Concepts (Long Term Memory) - Remove Text Blobs
     concepts_path = os.path.join(MEMORY_DIR, "brain_concepts.json")
     if os.path.exists(concepts_path):
         try:
-            with open(concepts_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(concepts_path, 'rb') as f:
+                raw = f.read()
+            data = _loads(raw)
             
             concepts = data.get("concepts", {})
             original_count = len(concepts)
             
             # Filter out keys that look like sentences (Zombie Phrases)
             # Threshold: Length > 10 AND contains specific patterns or just too long
-            new_concepts = {}
-            deleted_count = 0
-            
-            for k, v in concepts.items():
-                is_zombie = False
-                if len(k) > 15: is_zombie = True
-                if "カナメ" in k and len(k) > 6: is_zombie = True
-                if "良い子" in k: is_zombie = True
-                
-                if is_zombie:
-                    print(f"💀 Detected Zombie Concept: {k}")
-                    deleted_count += 1
-                else:
-                    new_concepts[k] = v
             
-            data["concepts"] = new_concepts
+            # Neither marker anywhere in the file (and no \u escapes hiding one) -> only the length rule can fire
+            if b"\\u" not in raw and not any(m in raw for m in _ZOMBIE_MARKERS):
+                zombies = [k for k in concepts if len(k) > 15]
+            else:
+                zombies = [k for k in concepts if _is_zombie(k)]
             
-            with open(concepts_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False)
+            deleted_count = len(zombies)
+            if deleted_count == 0:
+                print(f"✨ Concepts already clean ({original_count} entries). No rewrite needed.")
+            else:
+                # Summary instead of one print per zombie
+                preview = ", ".join(zombies[:10]) + (" ..." if deleted_count > 10 else "")
+                print(f"💀 Detected {deleted_count} Zombie Concepts: {preview}")
                 
-            print(f"✅ Cleaned Concepts: {original_count} -> {len(new_concepts)} (Purged {deleted_count})")
+                zombie_set = set(zombies)
+                new_concepts = {k: v for k, v in concepts.items() if k not in zombie_set}
+                data["concepts"] = new_concepts
+                with open(concepts_path, 'wb') as f:
+                    f.write(_dumps(data))
+                    
+                print(f"✅ Cleaned Concepts: {original_count} -> {len(new_concepts)} (Purged {deleted_count})")
             
         except Exception as e:
             print(f"❌ Failed to clean concepts: {e}")
@@ -1,7 +1,6 @@
 
 import sys
 import os
-import time
 
 # Setup Paths
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -39,24 +38,21 @@ def inject():
     # Initialize Brain (Headless)
     brain = KanameBrain()
     
-    # Wait for initialization (Embeddings etc)
-    time.sleep(2)
+    # Wait for initialization (returns immediately once __init__ has finished)
+    if not brain.ready_event.wait(timeout=10):
+        print("⚠️ Brain not ready after 10s. Injecting anyway.")
     
-    count = 0
-    for word in VOCAB_LIST:
-        print(f"   📖 Learning: {word}")
-        
-        # 1. Reinforce in Memory (Create Concept)
-        # Use activate_concept which handles creation/embedding
-        brain.activate_concept(word, boost=0.5)
-        
-        # 2. Also Learn in Sedimentary Cortex (Context)
-        if hasattr(brain, 'sedimentary_cortex'):
-            brain.sedimentary_cortex.learn(word, "VOCAB_INJECT", surprise=0.1)
-        elif hasattr(brain, 'cortex'):
-             brain.cortex.learn(word, "VOCAB_INJECT", surprise=0.1)
-        
-        count += 1
+    # 1. Reinforce in Memory (Create Concepts) - one lock acquisition for the whole list
+    print(f"   📖 Learning: {', '.join(VOCAB_LIST)}")
+    brain.activate_concepts_batch(VOCAB_LIST, boost=0.5)
+    
+    # 2. Also Learn in Sedimentary Cortex (Context) - one SQLite transaction
+    if hasattr(brain, 'sedimentary_cortex'):
+        brain.sedimentary_cortex.learn_batch(VOCAB_LIST, "VOCAB_INJECT", surprise=0.1)
+    elif hasattr(brain, 'cortex'):
+        brain.cortex.learn_batch(VOCAB_LIST, "VOCAB_INJECT", surprise=0.1)
+    
+    count = len(VOCAB_LIST)
         
     print(f"✅ Injection Complete. {count} words added.")
 
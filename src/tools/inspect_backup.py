@@ -3,6 +3,27 @@ import os
 
 BACKUP_PATH = "memory_data/rnn_weights_128.npy.bak"
 
+def _iter_weights(path):
+    """
+    (key, array) を1つずつ返す。
+    npz (SimpleRNN.save の形式): 配列はアクセスした時に1つずつ読まれる (pickle 無し)
+    旧 .npy (pickle dict): 全体の復元は避けられないので、返したキーから手放していく
+    np.load は拡張子ではなくマジックナンバーで判定するので .bak のままで良い
+    """
+    data = np.load(path, allow_pickle=False) if _is_npz(path) else np.load(path, allow_pickle=True).item()
+    if isinstance(data, dict):
+        while data:
+            key = next(iter(data))
+            yield key, data.pop(key)
+    else:
+        with data:
+            for key in data.files:
+                yield key, data[key]
+
+def _is_npz(path):
+    with open(path, "rb") as f:
+        return f.read(4) == b"PK\x03\x04"
+
 def inspect():
     if not os.path.exists(BACKUP_PATH):
         print(f"❌ Backup file not found at: {BACKUP_PATH}")
@@ -10,26 +31,27 @@ def inspect():
 
     print(f"📦 Loading Backup: {BACKUP_PATH}")
     try:
-        data = np.load(BACKUP_PATH, allow_pickle=True).item()
-        
         print("\n--- 🧠 Old Brain Specs (128 Units) ---")
-        for key, val in data.items():
+
+        # Metrics are reduced as each array streams past (float32 accumulators, no fp64 copies)
+        energy = None
+        roughness = None
+        for key, val in _iter_weights(BACKUP_PATH):
             print(f"  • {key}: {val.shape}")
+            if key in ("Wxh", "Whh"):
+                energy = (energy or 0.0) + float(np.mean(np.abs(val, dtype=np.float32)))
+            if key == "Whh":
+                roughness = float(np.std(val, dtype=np.float32))
+            del val
 
-        # Calculate Metrics
-        wxh = data.get("Wxh")
-        whh = data.get("Whh")
-        
-        if wxh is not None:
-            energy = np.mean(np.abs(wxh)) + np.mean(np.abs(whh))
+        if energy is not None:
             print(f"\n🔋 Energy (Synaptic Strength): {energy:.4f}")
-            
-        if whh is not None:
-            roughness = np.std(whh)
-            print(f"🌊 Roughness await(Complexity): {roughness:.4f}")
-            
+
+        if roughness is not None:
+            print(f"🌊 Roughness (Complexity): {roughness:.4f}")
+
         print("\n✅ Verification: This is a valid frozen brain file.")
-        
+
     except Exception as e:
         print(f"⚠️ Error reading file: {e}")
 
@@ -3,12 +3,30 @@
 # 🔥 Pre-Demon: 自動バグ検出スクリプト
 # コード変更後に実行して、既知の危険パターンを検出する
 
+import hashlib
 import os
 import re
 import sys
+from array import array
+from bisect import bisect_left
 from pathlib import Path
-from typing import List, Tuple, Dict
-from collections import defaultdict
+from typing import List, Tuple, Dict, Iterator, Optional
+from collections import Counter
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+
+# Setup Paths (standalone execution: python src/tools/pre_demon.py)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BASE_DIR not in sys.path:
+    sys.path.append(BASE_DIR)
+
+from src.fastjson import loads as _loads, dumps as _dumps
+
+# Hyperscan (optional): 全パターンを1つのDFAにして、ファイル全体を1パスで走査する
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 # ================================================================
 # 🎯 危険パターン定義
@@ -59,71 +77,254 @@ EXCLUDE_PATTERNS = [
     r'with\s+self\.\w*lock',  # lockを使っている
 ]
 
+# ================================================================
+# ⚡ コンパイル済みパターン (import時に1回だけ)
+# ================================================================
+
+# 深刻度 (レポート順)。検出結果には文字列ではなくこの添字を持たせる
+SEVERITY_ORDER = ('🔴 CRITICAL', '🟠 MAJOR', '🟡 MINOR', '⚪ INFO')
+SEV_ID = {severity: i for i, severity in enumerate(SEVERITY_ORDER)}
+
+# 検出結果 (Finding) は辞書ではなくタプル: (file, line, severity_id, pattern_id, content)
+# 深刻度は SEVERITY_ORDER、説明文は PATTERNS[pattern_id][2] を引く
+F_FILE, F_LINE, F_SEV, F_PATTERN, F_CONTENT = range(5)
+Finding = Tuple[str, int, int, int, str]
+
+# 個別パターン: 候補行で (深刻度ID, パターンID) ごとに判定する
+COMPILED_PATTERNS = [(re.compile(p), SEV_ID[severity], i) for i, (p, severity, _) in enumerate(PATTERNS)]
+
+# 全パターンの和 (union): 1回の search で「どれかにマッチするか」を判定する
+# 大半の行はここで落ちるので、個別パターンは候補行だけで走る
+MASTER_RE = re.compile('|'.join(f'(?:{p})' for p, _, _ in PATTERNS))
+EXCLUDE_RE = re.compile('|'.join(f'(?:{p})' for p in EXCLUDE_PATTERNS))
+
+
+def _build_hyperscan_db():
+    """
+    全パターンを Hyperscan DB にコンパイル (失敗したら None → re にフォールバック)
+    PREFILTER: 非対応構文 (先読み等) は上位集合に緩めてコンパイルされる。
+    Hyperscan は候補行を出すだけで、最終判定は COMPILED_PATTERNS が行うので結果は同じ。
+    """
+    if hyperscan is None:
+        return None
+    flags = hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP  # \w, \d を re と同じUnicode解釈に
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=[p.encode('utf-8') for p, _, _ in PATTERNS],
+            ids=list(range(len(PATTERNS))),
+            elements=len(PATTERNS),
+            flags=[flags] * len(PATTERNS),
+        )
+        return db
+    except Exception as e:
+        print(f"⚠️ Hyperscan compile failed, using re: {e}")
+        return None
+
+HS_DB = _build_hyperscan_db()
+
+
+def _hyperscan_candidate_lines(data: bytes, n_lines: int) -> List[int]:
+    """Hyperscan で1パス走査し、マッチの終端がある行番号 (1始まり, 昇順) を返す"""
+    newlines = array('i', (m.start() for m in re.finditer(b'\n', data)))
+    hits = set()
+    
+    def on_match(pattern_id, start, end, flags, context):
+        # end は排他的 → 最後の文字 (end-1) を含む行
+        hits.add(bisect_left(newlines, end - 1) + 1)
+    
+    HS_DB.scan(data, match_event_handler=on_match)
+    return sorted(n for n in hits if n <= n_lines)
+
+
+def _line_starts(text: str) -> array:
+    """
+    各行の開始オフセット (str 単位)。末尾に len(text) の番兵を置くので
+    n 行目 (1始まり) は text[starts[n-1]:starts[n]]、行数は len(starts) - 1
+    """
+    starts = array('i', [0])
+    starts.extend(m.end() for m in re.finditer('\n', text))
+    if starts[-1] != len(text):
+        starts.append(len(text))  # 改行で終わらない最終行
+    return starts
+
 # ================================================================
 # 📂 スキャン対象
 # ================================================================
 
 SCAN_DIRS = ['src']
 EXCLUSIONS = ['__pycache__', '.git', 'venv', 'MeloTTS', 'models', 'memory']
-FILE_EXTENSIONS = ['.py']
+FILE_EXTENSIONS = ('.py',)  # tuple: str.endswith がそのまま受け取れる
+PARALLEL_MIN_FILES = 200     # これ未満はプロセス起動コストの方が高いので直列
+MAX_FILE_BYTES = 2 * 1024 * 1024  # これより大きいファイルは生成物とみなしてスキップ
+
+# どのパターンも、マッチするなら必ずこのどれかの文字列を含む (bytes の in = memmem)
+# PATTERNS を追加したら、ここにもその必須リテラルを足すこと
+REQUIRED_LITERALS = (b'self.', b'except', b'min', b'.0', b'sleep', b'# TODO', b'print', b'set')
+
+# ================================================================
+# 💾 スキャン結果キャッシュ (変更の無いファイルは再スキャンしない)
+# 削除すれば次回フルスキャン。パターン定義が変わったら自動で無効化
+# ================================================================
+
+CACHE_PATH = Path(__file__).resolve().parents[2] / '.pre_demon_cache.json'
+CACHE_VERSION = 2  # scan_file の出力形式を変えたら上げる
+RULES_DIGEST = hashlib.sha1(repr((PATTERNS, EXCLUDE_PATTERNS)).encode('utf-8')).hexdigest()
+
+
+def _file_signature(filepath) -> str:
+    """ mtime_ns:size - changes whenever the file is rewritten """
+    st = os.stat(filepath)
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def load_cache(path: Path = CACHE_PATH) -> Dict:
+    """ {filepath: {"sig": str, "findings": list}} from the previous run (or {}) """
+    try:
+        with open(path, 'rb') as f:
+            data = _loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != CACHE_VERSION or data.get('rules') != RULES_DIGEST:
+        return {}
+    return data.get('files', {})
+
+
+def save_cache(cache: Dict, path: Path = CACHE_PATH) -> None:
+    """ Atomic write (tmp + replace); entries for deleted files are dropped """
+    files = {k: v for k, v in cache.items() if os.path.exists(k)}
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps({'version': CACHE_VERSION, 'rules': RULES_DIGEST, 'files': files}))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️ Pre-Demon cache not saved: {e}")
 
 
 def should_exclude_line(line: str) -> bool:
     """除外パターンにマッチする行を判定"""
-    for pattern in EXCLUDE_PATTERNS:
-        if re.search(pattern, line):
-            return True
-    return False
+    return EXCLUDE_RE.search(line) is not None
 
 
-def scan_file(filepath: Path) -> List[Dict]:
+def scan_file(filepath: Path) -> List[Finding]:
     """単一ファイルをスキャン"""
     findings = []
     
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > MAX_FILE_BYTES:
+                print(f"⏭️ Skipping large file: {filepath}")
+                return findings
+            data = f.read()
     except Exception as e:
         print(f"⚠️ Cannot read {filepath}: {e}")
         return findings
     
-    for line_num, line in enumerate(lines, 1):
+    # 危険パターンの材料が1つも無いファイルは行分割すらしない
+    if not any(lit in data for lit in REQUIRED_LITERALS):
+        return findings
+    
+    # テキストモードの open() と同じ行分割 (universal newlines) を、行リストを作らずに行う
+    # 行は starts のオフセットだけで表し、文字列に切り出すのは候補行のみ
+    text = data.decode('utf-8', errors='ignore')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    starts = _line_starts(text)
+    n_lines = len(starts) - 1
+    
+    exclude_search = EXCLUDE_RE.search
+    file_str = str(filepath)  # 1ファイル1オブジェクトを全指摘で共有
+    
+    # 候補行: どれかのパターンにマッチし得る行だけ (大半の行はここで落ちる)
+    if HS_DB is not None:
+        candidates = _hyperscan_candidate_lines(text.encode('utf-8'), n_lines)
+    else:
+        # search(text, pos, endpos) は text[pos:endpos] を検索するのと同じ結果 (コピー無し)
+        master_search = MASTER_RE.search  # union 1回で判定
+        candidates = [n for n in range(1, n_lines + 1) if master_search(text, starts[n - 1], starts[n])]
+    
+    for line_num in candidates:
+        line = text[starts[line_num - 1]:starts[line_num]]
+        
         # 除外チェック
-        if should_exclude_line(line):
+        if exclude_search(line):
             continue
         
-        # 各パターンをチェック
-        for pattern, severity, description in PATTERNS:
-            if re.search(pattern, line):
-                findings.append({
-                    'file': str(filepath),
-                    'line': line_num,
-                    'severity': severity,
-                    'description': description,
-                    'content': line.strip()[:60]
-                })
+        # 各パターンをチェック (1行に複数の指摘があり得るので個別に)
+        for pattern, sev_id, pattern_id in COMPILED_PATTERNS:
+            if pattern.search(line):
+                findings.append((file_str, line_num, sev_id, pattern_id, line.strip()[:60]))
     
     return findings
 
 
-def scan_directory(base_dir: Path) -> List[Dict]:
-    """ディレクトリを再帰的にスキャン"""
-    all_findings = []
+def _iter_source_files(directory) -> Iterator[Path]:
+    """
+    os.scandir で再帰列挙 (DirEntry の型情報キャッシュで stat を省く)
+    順序は os.walk (top-down) と同じ: そのディレクトリのファイル → サブディレクトリ
+    """
+    subdirs = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                # 除外ディレクトリをスキップ
+                if entry.name not in EXCLUSIONS:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith(FILE_EXTENSIONS) and entry.is_file():
+                yield Path(entry.path)
     
-    for root, dirs, files in os.walk(base_dir):
-        # 除外ディレクトリをスキップ
-        dirs[:] = [d for d in dirs if d not in EXCLUSIONS]
-        
-        for file in files:
-            if any(file.endswith(ext) for ext in FILE_EXTENSIONS):
-                filepath = Path(root) / file
-                findings = scan_file(filepath)
-                all_findings.extend(findings)
+    for subdir in subdirs:
+        yield from _iter_source_files(subdir)
+
+
+def scan_directory(base_dir: Path, cache: Optional[Dict] = None) -> List[Finding]:
+    """
+    ディレクトリを再帰的にスキャン
+    cache (load_cache の dict) を渡すと、mtime/size が同じファイルは前回の結果を使い、
+    スキャンしたファイルの結果を cache に書き戻す (保存は呼び出し側で save_cache)
+    """
+    # 1. 対象ファイルを先に列挙 (走査順 = レポート順)
+    filepaths = list(_iter_source_files(base_dir))
+    
+    # 2. キャッシュ照合: 変更の無いファイルは stat だけで済ませる
+    results = {}
+    misses = []
+    for filepath in filepaths:
+        key = str(filepath)
+        if cache is not None:
+            sig = _file_signature(filepath)
+            entry = cache.get(key)
+            if entry and entry.get('sig') == sig:
+                results[key] = entry['findings']
+                continue
+            misses.append((filepath, sig))
+        else:
+            misses.append((filepath, None))
+    
+    # 3. ファイル単位で独立 → 大きなツリーはプロセス並列 (regex は GIL を離さない)
+    #    パターンは import 時にコンパイル済みなので、各ワーカーは1回だけ払う
+    miss_paths = [fp for fp, _ in misses]
+    if len(miss_paths) >= PARALLEL_MIN_FILES and (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor() as ex:
+            scanned = list(ex.map(scan_file, miss_paths, chunksize=32))
+    else:
+        scanned = [scan_file(fp) for fp in miss_paths]
+    
+    for (filepath, sig), findings in zip(misses, scanned):
+        key = str(filepath)
+        results[key] = findings
+        if cache is not None:
+            cache[key] = {'sig': sig, 'findings': findings}
+    
+    all_findings = []
+    for filepath in filepaths:
+        all_findings.extend(results[str(filepath)])
     
     return all_findings
 
 
-def print_report(findings: List[Dict]) -> None:
+def print_report(findings: List[Finding]) -> None:
     """結果レポートを出力"""
     print("=" * 60)
     print("🔥 PRE-DEMON SCAN REPORT")
@@ -134,33 +335,29 @@ def print_report(findings: List[Dict]) -> None:
         print("✅ 危険パターンは検出されませんでした！")
         return
     
-    # 深刻度でグループ化
-    by_severity = defaultdict(list)
-    for f in findings:
-        by_severity[f['severity']].append(f)
+    # 深刻度別カウント (int 列の Counter)
+    counts = Counter(f[F_SEV] for f in findings)
     
-    # 深刻度順に出力
-    severity_order = ['🔴 CRITICAL', '🟠 MAJOR', '🟡 MINOR', '⚪ INFO']
-    
-    for severity in severity_order:
-        if severity in by_severity:
-            print(f"\n{severity} ({len(by_severity[severity])}件)")
+    # 深刻度順に出力 (sorted は安定なので、同じ深刻度内は走査順のまま)
+    current = None
+    for f in sorted(findings, key=itemgetter(F_SEV)):
+        if f[F_SEV] != current:
+            current = f[F_SEV]
+            print(f"\n{SEVERITY_ORDER[current]} ({counts[current]}件)")
             print("-" * 40)
-            
-            for f in by_severity[severity]:
-                rel_path = f['file'].replace('\\', '/')
-                print(f"  {rel_path}:{f['line']}")
-                print(f"    → {f['description']}")
-                print(f"    │ {f['content']}")
-                print()
+        
+        rel_path = f[F_FILE].replace('\\', '/')
+        print(f"  {rel_path}:{f[F_LINE]}")
+        print(f"    → {PATTERNS[f[F_PATTERN]][2]}")
+        print(f"    │ {f[F_CONTENT]}")
+        print()
     
     print("=" * 60)
     print(f"📊 Summary: {len(findings)} issues found")
     print("=" * 60)
     
-    # 深刻度別カウント
-    for severity in severity_order:
-        count = len(by_severity.get(severity, []))
+    for sev_id, severity in enumerate(SEVERITY_ORDER):
+        count = counts[sev_id]
         if count > 0:
             print(f"  {severity}: {count}")
 
@@ -173,19 +370,22 @@ def main():
     
     project_root = Path(__file__).parent.parent
     all_findings = []
+    cache = load_cache()
     
     for scan_dir in SCAN_DIRS:
         target = project_root / scan_dir
         if target.exists():
             print(f"📂 Scanning: {scan_dir}/")
-            findings = scan_directory(target)
+            findings = scan_directory(target, cache)
             all_findings.extend(findings)
     
+    save_cache(cache)
+    
     print()
     print_report(all_findings)
     
     # CRITICALがあれば失敗
-    critical_count = len([f for f in all_findings if '🔴' in f['severity']])
+    critical_count = sum(1 for f in all_findings if f[F_SEV] == SEV_ID['🔴 CRITICAL'])
     if critical_count > 0:
         print(f"\n❌ {critical_count} CRITICAL issues found. Fix before commit!")
         sys.exit(1)
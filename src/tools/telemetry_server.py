@@ -3,10 +3,20 @@
 
 import asyncio
 import json
+import math
 import threading
 import time
+import numpy as np
 import websockets
 
+from src.fastjson import dumps as _dumps  # orjson if installed: UTF-8 bytes directly
+
+# websockets 14+ (new asyncio API) can send UTF-8 bytes as a text frame without re-encoding
+try:
+    _SEND_BYTES_AS_TEXT = int(websockets.__version__.split(".")[0]) >= 14
+except (AttributeError, ValueError):
+    _SEND_BYTES_AS_TEXT = False
+
 class TelemetryServer:
     def __init__(self, brain_ref, host="localhost", ws_port=8765, http_port=8080):
         self.brain = brain_ref
@@ -16,6 +26,15 @@ class TelemetryServer:
         self.clients = set()
         self.is_running = False
         
+        # Weight-matrix stats only change when the model trains: (model, weights_version, stats)
+        self._terrain_cache = None
+        self._scratch = None  # Reused float32 |W| buffer for the reductions
+        
+        # Vitals noise: drawn NOISE_BATCH ticks at a time (heart, respiration, temperature)
+        self._rng = np.random.default_rng()
+        self._noise_buf = []
+        self._noise_i = 0
+        
     async def handler(self, websocket):
         """Handle WebSocket connections"""
         self.clients.add(websocket)
@@ -76,53 +95,26 @@ class TelemetryServer:
                         "hidden_size": getattr(model, 'hidden_size', 0),
                     }
                     
-                    # Terrain stats (weight matrix analysis)
+                    # Terrain stats (weight matrix analysis) - recomputed only after weights change
                     if model.params:
-                        import numpy as np
-                        try:
-                            # Energy: Mean absolute value of weights
-                            wxh = model.params.get("Wxh", np.array([]))
-                            whh = model.params.get("Whh", np.array([]))
-                            why = model.params.get("Why", np.array([]))
-                            
-                            if wxh.size > 0:
-                                energy = float(np.mean(np.abs(wxh)) + np.mean(np.abs(whh)))
-                                rnn_data["terrain_energy"] = round(energy, 4)
-                            
-                            if whh.size > 0:
-                                # Roughness: Standard deviation (higher = more diverse patterns)
-                                roughness = float(np.std(whh))
-                                rnn_data["terrain_roughness"] = round(roughness, 4)
-                            
-                            if why.size > 0:
-                                # Output complexity
-                                output_energy = float(np.mean(np.abs(why)))
-                                rnn_data["output_energy"] = round(output_energy, 4)
-                            
-                            # Weight sample for oscilloscope (32 values from Whh diagonal)
-                            if whh.size > 0:
-                                diag = np.diag(whh)[:32] if whh.shape[0] >= 32 else np.diag(whh)
-                                normalized = (diag / (np.max(np.abs(diag)) + 1e-8)).tolist()
-                                rnn_data["weight_sample"] = [round(v, 4) for v in normalized]
-                                
-                        except Exception as e:
-                            pass
+                        rnn_data.update(self._terrain_stats(model))
                     
                     data["rnn"] = rnn_data
                 
                 # Vital Signs (heart rate, respiration derived from chemicals)
-                import random
-                import math
                 # Use the snapshot!
                 chemicals = chems_snapshot
                 
+                # Unit noise in [-1, 1) for this tick, scaled per vital below
+                noise_hr, noise_resp, noise_temp = self._next_noise()
+                
                 # HRV (Heart Rate Variability) - natural fluctuation
                 # Perlin-like smooth noise using sine waves
                 t = time.time()
                 hrv = (
                     math.sin(t * 0.5) * 2 +       # Slow wave (~0.08 Hz)
                     math.sin(t * 1.2) * 1.5 +     # Medium wave
-                    random.uniform(-1.5, 1.5)      # Random noise
+                    noise_hr * 1.5                 # Random noise (±1.5)
                 )
                 
                 # Heart Rate: 70 BPM base, modulated by emotions + HRV
@@ -145,12 +137,12 @@ class TelemetryServer:
                     chemicals.get("cortisol", 0) * 0.04 -
                     (4 if self.brain.is_sleeping else 0)
                 )
-                resp_noise = math.sin(t * 0.3) * 0.8 + random.uniform(-0.3, 0.3)
+                resp_noise = math.sin(t * 0.3) * 0.8 + noise_resp * 0.3
                 respiration = max(10, min(30, base_resp + resp_mod + resp_noise))
                 
                 # Body Temperature with micro-fluctuation
                 temp_base = 36.5 + chemicals.get("adrenaline", 0) * 0.005 # +0.5C at 100
-                temp_noise = math.sin(t * 0.1) * 0.1 + random.uniform(-0.05, 0.05)
+                temp_noise = math.sin(t * 0.1) * 0.1 + noise_temp * 0.05
                 temp = temp_base + temp_noise
                 
                 data["vitals"] = {
@@ -164,20 +156,89 @@ class TelemetryServer:
             print(f"Telemetry Error: {e}")
             return {}
 
+    NOISE_BATCH = 64
+
+    def _next_noise(self):
+        """ One tick of vitals noise (3 floats), refilled NOISE_BATCH ticks per RNG call """
+        if self._noise_i >= len(self._noise_buf):
+            self._noise_buf = self._rng.uniform(-1.0, 1.0, size=(self.NOISE_BATCH, 3)).tolist()
+            self._noise_i = 0
+        row = self._noise_buf[self._noise_i]
+        self._noise_i += 1
+        return row
+
+    def _terrain_stats(self, model):
+        """ Weight-matrix stats for the dashboard, cached per model.weights_version """
+        version = getattr(model, 'weights_version', None)
+        cached = self._terrain_cache
+        if version is not None and cached is not None and cached[0] is model and cached[1] == version:
+            return cached[2]
+        
+        stats = {}
+        try:
+            # Energy: Mean absolute value of weights
+            wxh = model.params.get("Wxh", np.array([]))
+            whh = model.params.get("Whh", np.array([]))
+            why = model.params.get("Why", np.array([]))
+            
+            if wxh.size > 0:
+                energy = self._mean_abs(wxh) + self._mean_abs(whh)
+                stats["terrain_energy"] = round(energy, 4)
+            
+            if whh.size > 0:
+                # Roughness: Standard deviation (higher = more diverse patterns)
+                roughness = float(np.std(whh, dtype=np.float32))
+                stats["terrain_roughness"] = round(roughness, 4)
+            
+            if why.size > 0:
+                # Output complexity
+                output_energy = self._mean_abs(why)
+                stats["output_energy"] = round(output_energy, 4)
+            
+            # Weight sample for oscilloscope (32 values from Whh diagonal)
+            if whh.size > 0:
+                diag = whh.diagonal()[:32]  # strided view: no H-length copy of the diagonal
+                normalized = diag / (np.max(np.abs(diag)) + 1e-8)
+                stats["weight_sample"] = [round(v, 4) for v in normalized.tolist()]
+                
+        except Exception as e:
+            pass
+        
+        self._terrain_cache = (model, version, stats)
+        return stats
+
+    def _mean_abs(self, w):
+        """
+        mean(|w|) through a reused float32 scratch buffer (no temporary per call).
+        fp64 weights (old checkpoints) are cast into it, so the pass moves half the bytes.
+        """
+        if w.size == 0:
+            return float("nan")  # np.mean of an empty array
+        scratch = self._scratch
+        if scratch is None or scratch.size < w.size:
+            scratch = self._scratch = np.empty(w.size, dtype=np.float32)  # Grows only when a matrix outgrows it
+        buf = scratch[:w.size].reshape(w.shape)
+        np.abs(w, out=buf, casting="same_kind")
+        return float(buf.mean(dtype=np.float32))
+
     async def broadcast_loop(self):
         """Periodically send telemetry to all clients"""
         while self.is_running:
             if self.clients:
                 data = self.get_telemetry()
-                message = json.dumps({"type": "telemetry", "data": data})
+                message = _dumps({"type": "telemetry", "data": data})  # UTF-8 bytes, encoded once
                 
-                # Send to all connected clients (iterate over copy to prevent mutation error)
-                disconnected = set()
-                for client in list(self.clients):
-                    try:
-                        await client.send(message)
-                    except:
-                        disconnected.add(client)
+                # Send to all connected clients concurrently (snapshot to prevent mutation error)
+                # One slow dashboard no longer delays the others; a failed send = disconnect
+                # Dashboards parse text frames: bytes go out as text, or are decoded once for old websockets
+                clients = list(self.clients)
+                if _SEND_BYTES_AS_TEXT:
+                    sends = (client.send(message, text=True) for client in clients)
+                else:
+                    message = message.decode("utf-8")
+                    sends = (client.send(message) for client in clients)
+                results = await asyncio.gather(*sends, return_exceptions=True)
+                disconnected = {client for client, res in zip(clients, results) if isinstance(res, BaseException)}
                 
                 self.clients -= disconnected
                 
@@ -0,0 +1,62 @@
+# tests/conftest.py
+# Shared pytest fixtures: heavy objects are built once and reused across tests
+
+import os
+import sys
+
+import pytest
+
+# プロジェクトルートをパスに追加 (pytest はテストモジュールより先に conftest を読む)
+# pytest 専用のテストファイルは各自で sys.path を触らない
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--live-net", action="store_true", default=False,
+        help="run tests marked live_net (real HTTP to external sites, e.g. aozora.gr.jp)",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "live_net: needs real network access; skipped unless --live-net is given")
+
+
+def pytest_collection_modifyitems(config, items):
+    """ 外部サイトを叩くテストは既定でスキップ (レート制限 / CI の速度) """
+    if config.getoption("--live-net"):
+        return
+    skip_live = pytest.mark.skip(reason="needs --live-net")
+    for item in items:
+        if "live_net" in item.keywords:
+            item.add_marker(skip_live)
+
+
+@pytest.fixture(scope="session")
+def prediction_engine():
+    """ PredictionEngine (ESN + embedding cache), one per test run """
+    from src.cortex.inference import PredictionEngine
+    return PredictionEngine()
+
+
+@pytest.fixture(scope="module")
+def brain():
+    """
+    Full KanameBrain, one per test module.
+    Module scope (not session): tests swap subsystems for mocks, so each file starts clean.
+    Imported lazily so modules that never ask for it don't pay for the brain's imports.
+    """
+    from src.brain_stem.brain import KanameBrain
+    return KanameBrain()
+
+
+@pytest.fixture
+def deterministic_random(monkeypatch):
+    """
+    random.random() を 0.0 に固定 (確率判定は全て「当たり」側)
+    monkeypatch なのでテスト終了時に自動で元に戻る。別の値が欲しいテストは monkeypatch で上書きする
+    """
+    monkeypatch.setattr("random.random", lambda: 0.0)
+    yield
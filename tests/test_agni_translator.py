@@ -4,7 +4,7 @@ Phase 16: AgniTranslator Unit Tests
 """
 
 import unittest
-from unittest.mock import MagicMock, PropertyMock
+from types import SimpleNamespace
 
 
 class MockHormoneManager:
@@ -34,8 +34,7 @@ class MockMemory:
 class MockAgni:
     def __init__(self):
         self.client = None  # No real API
-        self.limiter = MagicMock()
-        self.limiter.consume = MagicMock(return_value=False)
+        self.limiter = SimpleNamespace(consume=lambda block=True: False) # Rate limited: no API call
 
 
 class MockBrain:
@@ -1,15 +1,31 @@
 
+from unittest.mock import Mock, patch
+
+import pytest
+
 from src.body.aozora_harvester import AozoraHarvester
 
-def test_aozora_init():
+# 図書カードページ (走れメロス) の該当部分だけを再現したもの
+CARD_HTML = """
+<html><body>
+<table summary="ファイルのダウンロード">
+<tr><td><a href="./files/1567_ruby_4948.zip">1567_ruby_4948.zip</a></td></tr>
+</table>
+<a href="./files/1567_14913.html">いますぐXHTML版で読む</a>
+</body></html>
+"""
+
+@pytest.fixture(scope="session")
+def harvester():
+    return AozoraHarvester()
+
+def test_aozora_init(harvester):
     """初期化テスト"""
-    harvester = AozoraHarvester()
     assert len(harvester.WORKS) > 30, "作品リストが少なすぎます"
     assert harvester.cooldown == 300.0
 
-def test_aozora_get_random_work():
+def test_aozora_get_random_work(harvester):
     """作品選択テスト"""
-    harvester = AozoraHarvester()
     work = harvester._get_random_work()
     assert work is not None
     assert len(work) == 3
@@ -18,11 +34,26 @@ def test_aozora_get_random_work():
     assert isinstance(work[1], int)
     assert isinstance(work[2], str)
 
-def test_aozora_resolve_url():
-    """URL解決テスト (ネットワークアクセスなしで形式だけ確認したいが、実アクセスも許容)"""
-    harvester = AozoraHarvester()
+def test_aozora_resolve_url(harvester):
+    """URL解決テスト (HTTPはモック: カードページのURL組み立てとリンク抽出だけを確認)"""
+    with patch("src.body.aozora_harvester.requests.get", return_value=Mock(text=CARD_HTML)) as mock_get:
+        # 走れメロス (35, 1567)
+        url = harvester._resolve_file_url(35, 1567)
+
+    mock_get.assert_called_once_with("https://www.aozora.gr.jp/cards/000035/card1567.html", timeout=10)
+    assert url == "https://www.aozora.gr.jp/cards/000035/files/1567_14913.html"
+
+def test_aozora_resolve_url_no_link(harvester):
+    """HTML版へのリンクが無いカードページでは None"""
+    with patch("src.body.aozora_harvester.requests.get", return_value=Mock(text="<html></html>")):
+        assert harvester._resolve_file_url(35, 1567) is None
+
+@pytest.mark.live_net
+def test_aozora_resolve_url_live(harvester):
+    """URL解決テスト (本物の aozora.gr.jp に1回だけアクセス: --live-net 指定時のみ)"""
     # 走れメロス (35, 1567)
     url = harvester._resolve_file_url(35, 1567)
-    assert url is not None
-    assert "aozora.gr.jp" in url
-    assert "html" in url
+
+    assert url is not None, "カードページからHTML版のURLを取得できませんでした"
+    assert url.startswith("https://www.aozora.gr.jp/cards/000035/files/1567_")
+    assert url.endswith(".html")
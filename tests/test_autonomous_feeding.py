@@ -1,124 +1,92 @@
-import unittest
-from unittest.mock import MagicMock, patch, ANY
-import threading
-import time
-import sys
-import os
-import random
+from operator import attrgetter
+from unittest.mock import MagicMock
 
-# プロジェクトルートをパスに追加
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import pytest
 
-from src.brain_stem.brain import KanameBrain
 from src.body.hormones import Hormone
 from src.body.knowledge_harvesters import SourceType, HarvestedContent
 
-class TestAutonomousFeeding(unittest.TestCase):
-    def setUp(self):
-        # Brain の生成
-        self.brain = KanameBrain()
-        
-        # モック化
-        self.brain.feeder = MagicMock()
-        self.brain.aozora = MagicMock()
-        self.brain.knowledge_manager = MagicMock() # 追加
-        self.brain.cortex = MagicMock()
-        self.brain.cortex.stomach = MagicMock()
-        
-        # 初期状態チェック
-        self.brain.hormones.set(Hormone.GLUCOSE, 50.0)
+@pytest.fixture(scope="module")
+def fed_brain(brain):
+    """ モジュール共有の Brain (conftest.brain) に食料系のモックを1回だけ差し込む """
+    brain.feeder = MagicMock()
+    brain.aozora = MagicMock()
+    brain.knowledge_manager = MagicMock() # 追加
+    brain.cortex = MagicMock()
+    brain.cortex.stomach = MagicMock()
+    return brain
 
-    def test_hunger_trigger(self):
-        """血糖値が下がると foraging が呼ばれるか"""
-        
-        # 1. 血糖値を危険域まで下げる
-        self.brain.hormones.set(Hormone.GLUCOSE, 10.0)
-        
-        # 2. process_metabolism を実行 (time_step を調整してスロットルを回避)
-        self.brain.time_step = 10 
-        self.brain.process_metabolism(cpu_percent=10, memory_percent=10, current_hour=12)
-        
-        # 3. Feeder.check_food が呼ばれたか確認
-        self.brain.feeder.check_food.assert_called()
-        
-    def test_forage_and_eat_local(self):
-        """冷蔵庫に食料がある場合、それを食べるか"""
-        
-        # Feeder がファイルを返すように設定
-        self.brain.feeder.check_food.return_value = ["dummy.txt"]
-        self.brain.feeder.eat.return_value = "Digestion Report"
-        
-        self.brain.hormones.set(Hormone.GLUCOSE, 10.0)
-        self.brain.time_step = 10
-        
-        # Act
-        self.brain.process_metabolism(10, 10, 12)
-        
-        # Assert
-        self.brain.feeder.eat.assert_called()
-        
-        # 血糖値が回復しているか (30足されて40になるはず)
-        # update は非同期ロックなどあるかもしれないが、同期的に更新されるはず
-        glucose = self.brain.hormones.get(Hormone.GLUCOSE)
-        print(f"Glucose after eating local: {glucose}")
-        self.assertGreater(glucose, 10.0)
+@pytest.fixture(autouse=True)
+def _reset_brain(fed_brain):
+    # Brain は作り直さず、モックの呼び出し履歴/戻り値だけリセット
+    for mock in (fed_brain.feeder, fed_brain.aozora, fed_brain.knowledge_manager, fed_brain.cortex):
+        mock.reset_mock(return_value=True, side_effect=True)
+    
+    # 初期状態チェック
+    fed_brain.hormones.set(Hormone.GLUCOSE, 50.0)
 
-    def test_forage_aozora(self):
-        """冷蔵庫が空なら青空文庫に行くか"""
-        
-        # Feeder は空
-        self.brain.feeder.check_food.return_value = []
-        
-        # Aozora がテキストを返す
-        self.brain.aozora.harvest.return_value = "吾輩は猫である..."
-        
-        self.brain.hormones.set(Hormone.GLUCOSE, 10.0)
-        self.brain.time_step = 10
-        
-        # Act
-        self.brain.process_metabolism(10, 10, 12)
-        
-        # Assert
-        self.brain.aozora.harvest.assert_called()
-        self.brain.cortex.stomach.eat.assert_called_with("吾輩は猫である...")
-        
-        glucose = self.brain.hormones.get(Hormone.GLUCOSE)
-        print(f"Glucose after eating Aozora: {glucose}")
-        self.assertGreater(glucose, 10.0)
-
-    def test_forage_diverse(self):
-        """多様な知識ソースから摂取するか"""
-        
-        # Feeder は空
-        self.brain.feeder.check_food.return_value = []
-        
-        # Knowledge Manager がコンテンツを返す
-        dummy_content = HarvestedContent(
+# シナリオ: 未指定のキーはモックのまま (戻り値を設定しない)
+#   feeder_ret / feeder_eat_ret / aozora_ret / km_ret : 各食料源のモックが返す値
+#   random        : random.random() の固定値 (無ければ本物の乱数)
+#   expected_call : 呼ばれるべきモック (fed_brain からの属性パス)
+#   expected_eat  : cortex.stomach.eat に渡るべきテキスト
+#   glucose_range : 食後の血糖値 (下限, 上限) - 上限 None は下限より大きいことだけ確認
+SCENARIOS = [
+    # 血糖値が下がると foraging が呼ばれるか
+    pytest.param(dict(expected_call="feeder.check_food"), id="hunger_trigger"),
+    # 冷蔵庫に食料がある場合、それを食べるか (30足されて40になるはず)
+    pytest.param(dict(
+        feeder_ret=["dummy.txt"], feeder_eat_ret="Digestion Report",
+        expected_call="feeder.eat", glucose_range=(10.0, None),
+    ), id="forage_and_eat_local"),
+    # 冷蔵庫が空なら青空文庫に行くか
+    pytest.param(dict(
+        feeder_ret=[], aozora_ret="吾輩は猫である...",
+        expected_call="aozora.harvest", expected_eat="吾輩は猫である...", glucose_range=(10.0, None),
+    ), id="forage_aozora"),
+    # 多様な知識ソースから摂取するか (random.random < 0.7 で KnowledgeHarvest、10.0 + 15.0 = 25.0 (約))
+    pytest.param(dict(
+        feeder_ret=[],
+        km_ret=HarvestedContent(
             source=SourceType.WIKIPEDIA,
             title="Python",
             content="Python is a programming language...",
             url="http://wiki"
-        )
-        self.brain.knowledge_manager.harvest_random.return_value = dummy_content
-        
-        self.brain.hormones.set(Hormone.GLUCOSE, 10.0)
-        self.brain.time_step = 10
-        
-        # random.random < 0.7 で多様なソースを選ぶようにモック
-        with patch('random.random') as mock_random:
-            mock_random.return_value = 0.5 # 0.7未満なら KnowledgeHarvest
-            
-            # Act
-            self.brain.process_metabolism(10, 10, 12)
-            
-            # Assert
-            self.brain.knowledge_manager.harvest_random.assert_called()
-            self.brain.cortex.stomach.eat.assert_called_with("Python is a programming language...")
-            
-            glucose = self.brain.hormones.get(Hormone.GLUCOSE)
-            print(f"Glucose after snacking: {glucose}")
-            # 10.0 + 15.0 = 25.0 (約)
-            self.assertTrue(24.0 < glucose < 26.0)
+        ),
+        random=0.5,
+        expected_call="knowledge_manager.harvest_random",
+        expected_eat="Python is a programming language...", glucose_range=(24.0, 26.0),
+    ), id="forage_diverse"),
+]
 
-if __name__ == "__main__":
-    unittest.main()
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_autonomous_feeding(fed_brain, monkeypatch, scenario):
+    if "feeder_ret" in scenario:
+        fed_brain.feeder.check_food.return_value = scenario["feeder_ret"]
+    if "feeder_eat_ret" in scenario:
+        fed_brain.feeder.eat.return_value = scenario["feeder_eat_ret"]
+    if "aozora_ret" in scenario:
+        fed_brain.aozora.harvest.return_value = scenario["aozora_ret"]
+    if "km_ret" in scenario:
+        fed_brain.knowledge_manager.harvest_random.return_value = scenario["km_ret"]
+    if "random" in scenario:
+        monkeypatch.setattr("random.random", lambda: scenario["random"])
+    
+    # 血糖値を危険域まで下げ、time_step を調整してスロットルを回避
+    fed_brain.hormones.set(Hormone.GLUCOSE, 10.0)
+    fed_brain.time_step = 10
+    
+    # Act
+    fed_brain.process_metabolism(cpu_percent=10, memory_percent=10, current_hour=12)
+    
+    # Assert
+    attrgetter(scenario["expected_call"])(fed_brain).assert_called()
+    if "expected_eat" in scenario:
+        fed_brain.cortex.stomach.eat.assert_called_with(scenario["expected_eat"])
+    
+    if "glucose_range" in scenario:
+        low, high = scenario["glucose_range"]
+        glucose = fed_brain.hormones.get(Hormone.GLUCOSE)
+        assert glucose > low
+        if high is not None:
+            assert glucose < high
@@ -1,35 +1,27 @@
-import sys
-import os
-sys.path.append(os.getcwd())
+import numpy as np
 
-from src.cortex.inference import PredictionEngine
-
-def test_cache():
+def test_cache(prediction_engine):
     print("🧪 Testing Embedding Cache...")
-    engine = PredictionEngine()
-    
+    engine = prediction_engine
+    cache = engine.embedding_cache
+    hits_before = cache.hits  # Session-shared engine: compare against the starting count
+
     # First call - Cache Miss
     vec1 = engine._get_embedding("Hello World", 12)
-    print(f"1st call: {engine.embedding_cache.get_stats()}")
-    
+    print(f"1st call: {cache.get_stats()}")
+
     # Second call - Same text - Should be Cache Hit
     vec2 = engine._get_embedding("Hello World", 12)
-    print(f"2nd call: {engine.embedding_cache.get_stats()}")
-    
+    print(f"2nd call: {cache.get_stats()}")
+
     # Third call - Different text - Cache Miss
     vec3 = engine._get_embedding("Goodbye Moon", 12)
-    print(f"3rd call: {engine.embedding_cache.get_stats()}")
-    
-    # Verify cache hit worked
-    if engine.embedding_cache.hits >= 1:
-        print("✅ PASS: Cache Hit detected!")
-        with open("cache_test_result.txt", "w", encoding="utf-8") as f:
-            f.write("PASS\n")
-            f.write(engine.embedding_cache.get_stats())
-    else:
-        print("❌ FAIL: No cache hits")
-        with open("cache_test_result.txt", "w", encoding="utf-8") as f:
-            f.write("FAIL\n")
+    print(f"3rd call: {cache.get_stats()}")
+
+    # Same text -> same vector (cached or hashed), different text -> different vector
+    assert np.array_equal(vec1, vec2)
+    assert not np.array_equal(vec1, vec3)
 
-if __name__ == "__main__":
-    test_cache()
+    # The cache sits in front of the embedding API: only exercised when the API answered
+    if "Hello World" in cache.cache:
+        assert cache.hits > hits_before, "No cache hits"
@@ -1,10 +1,6 @@
 # test_events.py
 # Unit Tests for EventBus
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src.body.events import Event, EventBus
 
 
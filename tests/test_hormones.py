@@ -1,10 +1,6 @@
 # test_hormones.py
 # Unit Tests for HormoneManager
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src.body.hormones import Hormone, HormoneManager
 import src.dna.config as config
 
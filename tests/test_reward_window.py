@@ -0,0 +1,70 @@
+# test_reward_window.py
+# Unit Tests for RewardWindow (incremental mean / max over the last N rewards)
+
+from src.games.minecraft.reward_window import RewardWindow
+
+
+def test_empty_stats():
+    """空の窓は平均/最大とも 0.0"""
+    w = RewardWindow(maxlen=3)
+    assert len(w) == 0
+    assert w.mean == 0.0
+    assert w.max == 0.0
+
+
+def test_mean_and_max_before_full():
+    """窓が満杯になる前は単純な平均/最大"""
+    w = RewardWindow(maxlen=3)
+    for r in (1.0, -2.0, 4.0):
+        w.append(r)
+    assert len(w) == 3
+    assert w.mean == 1.0
+    assert w.max == 4.0
+
+
+def test_eviction_updates_sum():
+    """満杯の窓では最古の報酬が押し出され、合計からも引かれる"""
+    w = RewardWindow(maxlen=3)
+    for r in (1.0, 2.0, 3.0, 6.0):
+        w.append(r)
+    assert list(w.history) == [2.0, 3.0, 6.0]
+    assert w.mean == 11.0 / 3
+
+
+def test_evicting_max_recomputes():
+    """最大値そのものが押し出されたら、残りの窓から最大値を再計算する"""
+    w = RewardWindow(maxlen=3)
+    for r in (5.0, 1.0, 2.0):
+        w.append(r)
+    assert w.max == 5.0
+
+    w.append(0.5) # 5.0 が押し出される
+    assert list(w.history) == [1.0, 2.0, 0.5]
+    assert w.max == 2.0
+
+    w.append(0.0) # 1.0 が押し出される (最大値ではない)
+    assert w.max == 2.0
+
+    w.append(-1.0) # 2.0 (最大値) が押し出される
+    assert w.max == 0.5
+
+
+def test_evicting_non_max_keeps_max():
+    """最大値以外が押し出されても最大値は変わらない"""
+    w = RewardWindow(maxlen=2)
+    w.append(1.0)
+    w.append(9.0)
+    w.append(3.0) # 1.0 が押し出される
+    assert w.max == 9.0
+    assert w.mean == 6.0
+
+
+def test_negative_rewards_only():
+    """全て負の報酬でも最大値は窓内の最大 (初期値 -inf から更新される)"""
+    w = RewardWindow(maxlen=2)
+    w.append(-3.0)
+    w.append(-1.0)
+    w.append(-2.0) # -3.0 が押し出される
+    assert w.max == -1.0
+    w.append(-5.0) # -1.0 (最大値) が押し出される
+    assert w.max == -2.0
@@ -1,10 +1,6 @@
 # test_soliloquy.py
 # Unit Tests for SoliloquyManager
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import time
 from unittest.mock import MagicMock, PropertyMock
 